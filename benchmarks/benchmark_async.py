@@ -0,0 +1,97 @@
+from kyber_py.ml_kem import ML_KEM_768
+from kyber_py.ml_kem.default_parameters import DEFAULT_PARAMETERS
+from kyber_py.ml_kem.asynchronous import AsyncML_KEM
+from time import perf_counter
+import asyncio
+
+
+class DirectML_KEM:
+    """
+    Calls ML-KEM directly in the event loop, for comparison
+    """
+
+    kem = ML_KEM_768
+
+    async def keygen(self):
+        return self.kem.keygen()
+
+    async def encaps(self, ek):
+        return self.kem.encaps(ek)
+
+    async def decaps(self, dk, c):
+        return self.kem.decaps(dk, c)
+
+
+async def ticker(lags, interval, stop):
+    """
+    Record how late the event loop wakes up a task sleeping for interval
+    """
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lags.append(loop.time() - start - interval)
+
+
+async def client(kem, ek, dk, count):
+    """
+    A mixed load of key generation, encapsulation and decapsulation
+    """
+    for _ in range(count):
+        await kem.keygen()
+        _, c = await kem.encaps(ek)
+        await kem.decaps(dk, c)
+
+
+async def mixed_load(kem, clients, count):
+    ek, dk = ML_KEM_768.keygen()
+    lags, stop = [], asyncio.Event()
+    tick = asyncio.create_task(ticker(lags, 0.001, stop))
+    start = perf_counter()
+    await asyncio.gather(*[client(kem, ek, dk, count) for _ in range(clients)])
+    elapsed = perf_counter() - start
+    stop.set()
+    await tick
+    lags.sort()
+    ops = 3 * clients * count
+    return ops / elapsed, lags[len(lags) // 2], lags[-1]
+
+
+def benchmark_async(name, make_kem, clients, count):
+    async def main():
+        kem = make_kem()
+        try:
+            return await mixed_load(kem, clients, count)
+        finally:
+            if hasattr(kem, "aclose"):
+                await kem.aclose()
+
+    ops, p50, worst = asyncio.run(main())
+    print(
+        f" {name:11} |"
+        f"{ops:8.1f} |"
+        f"{p50 * 1e3:9.2f}ms |"
+        f"{worst * 1e3:9.2f}ms |"
+    )
+
+
+if __name__ == "__main__":
+    clients, count = 8, 10
+    params = DEFAULT_PARAMETERS["ML768"]
+    # common banner
+    print("-" * 48)
+    print("    Mode     |  ops/s  | lag (p50)  | lag (max)  |")
+    print("-" * 48)
+    benchmark_async("direct", DirectML_KEM, clients, count)
+    benchmark_async(
+        "thread",
+        lambda: AsyncML_KEM(params, executor="thread"),
+        clients,
+        count,
+    )
+    benchmark_async(
+        "process",
+        lambda: AsyncML_KEM(params, executor="process"),
+        clients,
+        count,
+    )
@@ -0,0 +1,50 @@
+from hashlib import shake_128, shake_256
+from timeit import repeat
+import os
+
+
+def benchmark_call(name, fresh, copied, count):
+    t_fresh = min(repeat(fresh, number=count, repeat=5)) / count
+    t_copied = min(repeat(copied, number=count, repeat=5)) / count
+    print(
+        f" {name:11} |"
+        f"{t_fresh * 1e6:7.3f}us |"
+        f"{t_copied * 1e6:7.3f}us |"
+        f"{(t_fresh - t_copied) * 1e9:8.1f}ns |"
+    )
+
+
+if __name__ == "__main__":
+    count = 100000
+    seed = os.urandom(32)
+    index = bytes([1, 2])
+    xof_state = shake_128(seed)
+    prf_state = shake_256(seed)
+
+    def xof_fresh():
+        return shake_128(seed + index).digest(504)
+
+    def xof_copied():
+        xof = xof_state.copy()
+        xof.update(index)
+        return xof.digest(504)
+
+    def prf_fresh(eta):
+        return shake_256(seed + index[:1]).digest(64 * eta)
+
+    def prf_copied(eta):
+        prf = prf_state.copy()
+        prf.update(index[:1])
+        return prf.digest(64 * eta)
+
+    # common banner
+    print("-" * 49)
+    print("    Call     |   fresh   |  copied   |  saving   |")
+    print("-" * 49)
+    benchmark_call("XOF", xof_fresh, xof_copied, count)
+    benchmark_call(
+        "PRF eta=2", lambda: prf_fresh(2), lambda: prf_copied(2), count
+    )
+    benchmark_call(
+        "PRF eta=3", lambda: prf_fresh(3), lambda: prf_copied(3), count
+    )
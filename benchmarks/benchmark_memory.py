@@ -0,0 +1,50 @@
+from kyber_py.ml_kem import ML_KEM_512, ML_KEM_768, ML_KEM_1024
+import tracemalloc
+
+
+def parse_ek(ML_KEM, ek, compact):
+    k = ML_KEM.k
+    t_hat = ML_KEM.M.decode_vector(ek[:-32], k, 12, is_ntt=True)
+    A_hat = ML_KEM._generate_matrix_from_seed(ek[-32:], transpose=True)
+    if compact:
+        t_hat.compact()
+        A_hat.compact()
+    return t_hat, A_hat
+
+
+def memory_ml_kem(ML_KEM, name, count):
+    """
+    Compare the memory of parsed encapsulation keys stored as lists of
+    python integers, as before calling compact(), with their compact
+    arrays. Both layouts are those of the current code, so this is not a
+    comparison with earlier releases, whose polynomials also carried a
+    __dict__.
+    """
+    ek, _ = ML_KEM.keygen()
+    sizes = []
+    for compact in (False, True):
+        tracemalloc.start()
+        keys = [parse_ek(ML_KEM, ek, compact) for _ in range(count)]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        sizes.append(size / count)
+        del keys
+
+    print(
+        f" {name:11} |"
+        f"{sizes[0] / 1024:9.1f}KiB |"
+        f"{sizes[1] / 1024:9.1f}KiB |"
+        f"{sizes[0] / sizes[1]:7.1f}x |"
+    )
+
+
+if __name__ == "__main__":
+    count = 100
+    # common banner
+    print("Parsed encapsulation keys, lists vs compact() in this tree")
+    print("-" * 52)
+    print("   Params    |     list     |   compact    | ratio  |")
+    print("-" * 52)
+    memory_ml_kem(ML_KEM_512, "ML-KEM-512", count)
+    memory_ml_kem(ML_KEM_768, "ML-KEM-768", count)
+    memory_ml_kem(ML_KEM_1024, "ML-KEM-1024", count)
@@ -2,9 +2,11 @@ import os
 from hashlib import sha3_256, sha3_512, shake_128, shake_256
 from ..modules.modules import Module
 from ..utilities.utils import select_bytes
+from ..utilities.cache import MatrixCacheMixin
+from ..utilities.xof import Shake128Stream
 
 
-class Kyber:
+class Kyber(MatrixCacheMixin):
     def __init__(self, parameter_set):
         """
         Initialise Kyber with specified lattice parameters.
@@ -56,21 +58,16 @@ class Kyber:
         XOF: B^* x B x B -> B*
 
         NOTE:
-          We use hashlib's ``shake_128`` implementation, which does not support
-          an easy XOF interface, so we take the "easy" option and request a
-          fixed number of 840 bytes (5 invocations of Keccak), rather than
-          creating a byte stream.
-
-          If your code crashes because of too few bytes, you can get dinner at:
-          Casa de Chá da Boa Nova
-          https://cryptojedi.org/papers/terminate-20230516.pdf
+          The output is returned as a stream, which squeezes hashlib's
+          ``shake_128`` in blocks of 168 bytes as they are needed by the
+          sampler, see :py:class:`Shake128Stream`.
         """
         input_bytes = bytes32 + i + j
         if len(input_bytes) != 34:
             raise ValueError(
                 "Input bytes should be one 32 byte array and 2 single bytes."
             )
-        return shake_128(input_bytes).digest(840)
+        return Shake128Stream(input_bytes)
 
     @staticmethod
     def _h(input_bytes):
@@ -111,10 +108,14 @@ class Kyber:
         Helper function which generates a element in the
         module from the Centered Binomial Distribution.
         """
+        # The seed is absorbed once, and the hash state is copied for each
+        # element, which is equivalent to ``self._prf(sigma, N, 64 * eta)``
+        sigma_state = shake_256(sigma)
         elements = [self.R.zero() for _ in range(self.k)]
         for i in range(self.k):
-            input_bytes = self._prf(sigma, bytes([N]), 64 * eta)
-            elements[i] = self.R.cbd(input_bytes, eta)
+            prf = sigma_state.copy()
+            prf.update(bytes([N]))
+            elements[i] = self.R.cbd(prf.digest(64 * eta), eta)
             N += 1
         v = self.M.vector(elements)
         return v, N
@@ -135,13 +136,18 @@ class Kyber:
 
         When `transpose` is set to True, the matrix A is built as the transpose.
         """
+        # The seed is absorbed once, and the hash state is copied for each
+        # entry, which is equivalent to ``self._xof(rho, j, i)``
+        rho_state = shake_128(rho)
         A_data = [
-            [self.R.zero() for _ in range(self.k)] for _ in range(self.k)
+            [
+                self.R.ntt_sample(
+                    Shake128Stream(bytes([j, i]), state=rho_state)
+                )
+                for j in range(self.k)
+            ]
+            for i in range(self.k)
         ]
-        for i in range(self.k):
-            for j in range(self.k):
-                input_bytes = self._xof(rho, bytes([j]), bytes([i]))
-                A_data[i][j] = self.R.ntt_sample(input_bytes)
         A_hat = self.M(A_data, transpose=transpose)
         return A_hat
 
@@ -203,10 +209,10 @@ class Kyber:
         t_hat = self.M.decode_vector(t_hat_bytes, self.k, 12, is_ntt=True)
 
         # Encode message as polynomial
-        m_poly = self.R.decode(m, 1).decompress(1)
+        m_poly = self.R.decode_decompress(m, 1)
 
         # Generate the matrix A^T ∈ R^(kxk)
-        A_hat_T = self._generate_matrix_from_seed(rho, transpose=True)
+        A_hat_T = self._cached_matrix_from_seed(rho, transpose=True)
 
         # Set counter for PRF
         N = 0
@@ -227,8 +233,8 @@ class Kyber:
         v = v + e2 + m_poly
 
         # Ciphertext to bytes
-        c1 = u.compress(self.du).encode(self.du)
-        c2 = v.compress(self.dv).encode(self.dv)
+        c1 = u.compress_encode(self.du)
+        c2 = v.compress_encode(self.dv)
 
         return c1 + c2
 
@@ -247,11 +253,11 @@ class Kyber:
         c1, c2 = c[:index], c[index:]
 
         # Recover the vector u and convert to NTT form
-        u = self.M.decode_vector(c1, self.k, self.du).decompress(self.du)
+        u = self.M.decode_decompress_vector(c1, self.k, self.du)
         u_hat = u.to_ntt()
 
         # Recover the polynomial v
-        v = self.R.decode(c2, self.dv).decompress(self.dv)
+        v = self.R.decode_decompress(c2, self.dv)
 
         # s_transpose (already in NTT form)
         s_hat = self.M.decode_vector(sk, self.k, 12, is_ntt=True)
@@ -261,7 +267,7 @@ class Kyber:
         m = v - m
 
         # Return message as bytes
-        return m.compress(1).encode(1)
+        return m.compress_encode(1)
 
     def keygen(self):
         """
@@ -0,0 +1,244 @@
+"""
+An asyncio interface to ML-KEM.
+
+The operations of :py:class:`~kyber_py.ml_kem.ml_kem.ML_KEM` take
+milliseconds of pure python arithmetic, which would block an event loop
+and every other task running on it. :py:class:`AsyncML_KEM` runs them in a
+thread or process pool instead, with a bound on the number of operations
+in flight.
+"""
+
+import asyncio
+import os
+from collections import namedtuple
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from .ml_kem import ML_KEM
+from .parallel import _init_worker, _worker_call
+
+AsyncStats = namedtuple(
+    "AsyncStats",
+    ["queued", "running", "completed", "failed", "cancelled", "max_queued"],
+)
+
+
+class AsyncML_KEM:
+    """
+    Offload the operations of ML-KEM from the event loop to an executor.
+
+    ``executor`` is either ``"thread"`` for a thread pool, ``"process"``
+    for a process pool of ``max_workers`` workers, each holding its own
+    ``ML_KEM`` object, or an existing :py:class:`concurrent.futures.Executor`
+    used as a thread pool. An existing
+    :py:class:`concurrent.futures.ProcessPoolExecutor` is rejected, as its
+    workers lack their ``ML_KEM`` object. Threads only help while the
+    event loop waits on other tasks, as the arithmetic holds the GIL,
+    whereas a process pool also uses further cores.
+
+    At most ``max_concurrency`` operations, by default ``max_workers``, are
+    submitted to the executor at once and further calls wait in a queue.
+    The depth of this queue and the number of operations performed are
+    given by :py:meth:`stats`.
+
+    :param dict params: the lattice parameters, see
+        :py:data:`~kyber_py.ml_kem.default_parameters.DEFAULT_PARAMETERS`
+    :param str backend: the polynomial arithmetic backend
+    :param executor: ``"thread"``, ``"process"`` or an executor
+    :param int max_workers: the number of workers of the pool, by default
+        the number of CPUs
+    :param int max_concurrency: the maximum number of operations submitted
+        to the executor at once
+    """
+
+    def __init__(
+        self,
+        params,
+        backend="python",
+        executor="thread",
+        max_workers=None,
+        max_concurrency=None,
+    ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("The concurrency limit must be positive")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_concurrency = max_concurrency or self.max_workers
+        if isinstance(executor, ProcessPoolExecutor):
+            raise ValueError(
+                "Process pools are not supported, use executor='process'"
+            )
+        self.kem = ML_KEM(params, backend)
+
+        self._owns_executor = not isinstance(executor, Executor)
+        self._in_process = executor == "process"
+        if executor == "thread":
+            executor = ThreadPoolExecutor(self.max_workers)
+        elif executor == "process":
+            executor = ProcessPoolExecutor(
+                self.max_workers,
+                initializer=_init_worker,
+                initargs=(params, backend),
+            )
+        elif not isinstance(executor, Executor):
+            raise ValueError(
+                f"Unknown executor {executor}, expected 'thread', 'process' or an Executor"
+            )
+        self.executor = executor
+
+        # The semaphore is created on first use, within the event loop
+        self._semaphore = None
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._max_queued = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def close(self):
+        """
+        Shut down the executor when it was created by this object, waiting
+        for pending operations to finish. Within an event loop use
+        :py:meth:`aclose` instead, which does not block the loop.
+        """
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
+
+    async def aclose(self):
+        """
+        Shut down the executor as :py:meth:`close`, waiting for pending
+        operations to finish in a thread rather than in the event loop
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.close)
+
+    def stats(self):
+        """
+        Return the number of operations waiting for the concurrency limit
+        and running in the executor, the number of operations completed,
+        failed and cancelled, and the largest number of operations which
+        have waited at once
+
+        :rtype: AsyncStats
+        """
+        return AsyncStats(
+            self._queued,
+            self._running,
+            self._completed,
+            self._failed,
+            self._cancelled,
+            self._max_queued,
+        )
+
+    async def _run(self, method, *args):
+        """
+        Call a method of ML_KEM in the executor, once fewer than
+        ``max_concurrency`` operations are running.
+
+        An operation keeps its place in the executor until the call
+        returns, even when the awaiting task is cancelled, as the executor
+        cannot interrupt it.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        loop = asyncio.get_running_loop()
+
+        self._queued += 1
+        self._max_queued = max(self._max_queued, self._queued)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queued -= 1
+
+        self._running += 1
+        try:
+            if self._in_process:
+                # Loaded keys refer to the ML_KEM object of this process,
+                # so they are sent to the workers as bytes
+                args = [bytes(arg) for arg in args]
+                future = loop.run_in_executor(
+                    self.executor, _worker_call, method, *args
+                )
+            else:
+                future = loop.run_in_executor(
+                    self.executor, getattr(self.kem, method), *args
+                )
+        except BaseException:
+            self._release(None)
+            self._failed += 1
+            raise
+        future.add_done_callback(self._release)
+
+        try:
+            # The future is shielded so that cancelling the task does not
+            # release the permit while the call is still running
+            result = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            self._cancelled += 1
+            raise
+        except BaseException:
+            self._failed += 1
+            raise
+        self._completed += 1
+        return result
+
+    def _release(self, future):
+        """
+        Return the permit of an operation once its call in the executor has
+        finished
+        """
+        self._running -= 1
+        self._semaphore.release()
+        if future is not None and not future.cancelled():
+            # The result of a call whose task was cancelled is dropped
+            future.exception()
+
+    async def keygen(self):
+        """
+        Generate an encapsulation key and corresponding decapsulation key,
+        see :py:meth:`~kyber_py.ml_kem.ml_kem.ML_KEM.keygen`
+
+        :return: Tuple with encapsulation key and decapsulation key.
+        :rtype: tuple(bytes, bytes)
+        """
+        return await self._run("keygen")
+
+    async def key_derive(self, seed):
+        """
+        Derive an encapsulation key and corresponding decapsulation key from
+        a seed, see :py:meth:`~kyber_py.ml_kem.ml_kem.ML_KEM.key_derive`
+
+        :return: Tuple with encapsulation key and decapsulation key.
+        :rtype: tuple(bytes, bytes)
+        """
+        return await self._run("key_derive", seed)
+
+    async def encaps(self, ek):
+        """
+        Use the encapsulation key to generate a shared secret key and an
+        associated ciphertext, see
+        :py:meth:`~kyber_py.ml_kem.ml_kem.ML_KEM.encaps`
+
+        :param ek: byte-encoded encapsulation key, or one loaded with
+            ``self.kem.load_encapsulation_key()``
+        :return: a random key (``K``) and an encapsulation of it (``c``)
+        :rtype: tuple(bytes, bytes)
+        """
+        return await self._run("encaps", ek)
+
+    async def decaps(self, dk, c):
+        """
+        Use the decapsulation key to produce a shared secret key from a
+        ciphertext, see :py:meth:`~kyber_py.ml_kem.ml_kem.ML_KEM.decaps`
+
+        :param dk: decapsulation key, or one loaded with
+            ``self.kem.load_decapsulation_key()``
+        :param bytes c: ciphertext with an encapsulated key
+        :return: shared secret key (``K``)
+        :rtype: bytes
+        """
+        return await self._run("decaps", dk, c)
@@ -0,0 +1,93 @@
+"""
+Keys of ML-KEM which have been validated and decoded once, so that they
+can be used many times without repeating this work
+"""
+
+
+class _LoadedKey:
+    """
+    Base class of the loaded keys, whose attributes are set once when
+    they are created
+    """
+
+    __slots__ = ()
+
+    def __init__(self, **attributes):
+        for name, value in attributes.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+
+class EncapsulationKey(_LoadedKey):
+    """
+    An encapsulation key which has passed the type and modulus checks of
+    FIPS 203, holding the hash ``h`` of its encoding, together with the
+    decoded vector and the matrix expanded from its seed, which are
+    internal and shared with the arithmetic of ML-KEM.
+
+    Instances are created by
+    :py:meth:`~kyber_py.ml_kem.ml_kem.ML_KEM.load_encapsulation_key` and
+    are immutable. They may be passed to
+    :py:meth:`~kyber_py.ml_kem.ml_kem.ML_KEM.encaps` of the instance which
+    loaded them in place of the bytes of the key.
+    """
+
+    __slots__ = ("kem", "ek", "_t_hat", "_A_hat_T", "h", "validated")
+
+    def __init__(self, kem, ek, t_hat, A_hat_T, h):
+        super().__init__(
+            kem=kem,
+            ek=ek,
+            _t_hat=t_hat,
+            _A_hat_T=A_hat_T,
+            h=h,
+            validated=True,
+        )
+
+    def __bytes__(self):
+        return self.ek
+
+    def __eq__(self, other):
+        if not isinstance(other, EncapsulationKey):
+            return NotImplemented
+        return self.kem is other.kem and self.ek == other.ek
+
+    def __hash__(self):
+        return hash(self.ek)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.ek.hex()[:16]}...)"
+
+
+class DecapsulationKey(_LoadedKey):
+    """
+    A decapsulation key which has passed the type and hash checks of
+    FIPS 203, holding the implicit rejection value ``z`` and the
+    :py:class:`EncapsulationKey` ``ek`` it contains, used for the
+    re-encryption, together with the decoded secret vector, which is
+    internal.
+
+    Instances are created by
+    :py:meth:`~kyber_py.ml_kem.ml_kem.ML_KEM.load_decapsulation_key` and
+    are immutable. They may be passed to
+    :py:meth:`~kyber_py.ml_kem.ml_kem.ML_KEM.decaps` of the instance which
+    loaded them in place of the bytes of the key.
+    """
+
+    __slots__ = ("kem", "dk", "_s_hat", "ek", "z", "validated")
+
+    def __init__(self, kem, dk, s_hat, ek, z):
+        super().__init__(
+            kem=kem, dk=dk, _s_hat=s_hat, ek=ek, z=z, validated=True
+        )
+
+    def __bytes__(self):
+        return self.dk
+
+    def __repr__(self):
+        return f"{type(self).__name__}(ek={self.ek!r})"
@@ -4,18 +4,101 @@ https://nvlpubs.nist.gov/nistpubs/FIPS/NIST.FIPS.203.pdf
 """
 
 import os
+from collections import Counter
+from itertools import groupby
+from typing import Optional, Union
 from hashlib import sha3_256, sha3_512, shake_128, shake_256
 from ..modules.modules import Module, Matrix, Vector
-from ..polynomials.polynomials import Polynomial
+from ..polynomials.polynomials import (
+    PolynomialRing,
+    Polynomial,
+    PolynomialNTT,
+)
 from ..utilities.utils import select_bytes
-
-
-class ML_KEM:
-    def __init__(self, params: dict):
+from ..utilities.cache import MatrixCacheMixin
+from ..utilities.xof import Shake128Stream
+from .keys import DecapsulationKey, EncapsulationKey
+
+
+class CBDSampler:
+    """
+    Sample polynomials from the centered binomial distribution of FIPS 203,
+    with the pseudorandom function keyed by a 32 byte seed and the counter
+    N incremented for every polynomial drawn.
+
+    The seed is absorbed once, and the hash state is copied for each
+    polynomial, which is equivalent to ``ML_KEM._prf(eta, seed, N)``.
+    """
+
+    def __init__(self, ring: PolynomialRing, seed: bytes, N: int = 0):
+        if len(seed) != 32:
+            raise ValueError("The seed should be a 32 byte array.")
+        self.ring = ring
+        self.N = N
+        self._state = shake_256(seed)
+
+    def draw_bytes(self, eta: int, count: int) -> list[bytes]:
+        """
+        Return the outputs of the pseudorandom function for the next
+        ``count`` values of the counter N, each of which gives one
+        polynomial with
+        :py:meth:`~kyber_py.polynomials.polynomials.PolynomialRing.cbd`
+        """
+        outputs = []
+        for _ in range(count):
+            prf = self._state.copy()
+            prf.update(bytes([self.N]))
+            self.N += 1
+            outputs.append(prf.digest(eta * 64))
+        return outputs
+
+    def draw(
+        self, schedule: list[tuple[int, int, bool]]
+    ) -> list[list[Polynomial]]:
+        """
+        Draw the polynomials of every entry ``(eta, count, ntt)`` of the
+        schedule in order, returning a list of ``count`` polynomials for
+        each entry. When ``ntt`` is True the polynomials are returned in NTT
+        form.
+
+        Consecutive entries with the same ``eta`` in NTT form are sampled
+        into a single batch, which the ring transforms at once, see
+        :py:meth:`~kyber_py.polynomials.polynomials.PolynomialRing.cbd_to_ntt_batch`.
+        """
+        # The PRF is evaluated in the order of the schedule, and the
+        # entries are then grouped by their distribution and domain
+        entries = [
+            (eta, ntt, self.draw_bytes(eta, count))
+            for eta, count, ntt in schedule
+        ]
+        results = []
+        for (eta, ntt), group in groupby(entries, key=lambda e: e[:2]):
+            group = [inputs for _, _, inputs in group]
+            batch = [b for inputs in group for b in inputs]
+            if ntt:
+                polys = self.ring.cbd_to_ntt_batch(batch, eta)
+            else:
+                polys = [self.ring.cbd(b, eta) for b in batch]
+            i = 0
+            for inputs in group:
+                results.append(polys[i : i + len(inputs)])
+                i += len(inputs)
+        return results
+
+
+class ML_KEM(MatrixCacheMixin):
+    def __init__(self, params: dict, backend: str = "python"):
         """
         Initialise the ML-KEM with specified lattice parameters.
 
+        The polynomial arithmetic is performed either in pure python
+        (``backend="python"``) or with NumPy arrays (``backend="numpy"``).
+        When NumPy is not installed, the NumPy backend falls back to the
+        pure python implementation; the backend in use is stored in
+        ``self.backend``.
+
         :param dict params: the lattice parameters
+        :param str backend: the polynomial arithmetic backend
         """
         # ml-kem params
         self.k = params["k"]
@@ -24,7 +107,8 @@ class ML_KEM:
         self.du = params["du"]
         self.dv = params["dv"]
 
-        self.M = Module()
+        self.backend, ring = self._select_backend(backend)
+        self.M = Module(ring)
         self.R = self.M.ring
         self.oid = params["oid"] if "oid" in params else None
 
@@ -32,6 +116,25 @@ class ML_KEM:
         # use the method `set_drbg_seed()`
         self.random_bytes = os.urandom
 
+    @staticmethod
+    def _select_backend(backend: str) -> tuple[str, PolynomialRing]:
+        """
+        Return the name of the backend used and its polynomial ring,
+        falling back to pure python when NumPy is unavailable.
+        """
+        if backend == "numpy":
+            # NumPy is only imported when it is asked for, so that the
+            # default backend does not pay for loading it
+            from ..polynomials import polynomials_numpy
+
+            if polynomials_numpy.HAVE_NUMPY:
+                return "numpy", polynomials_numpy.PolynomialRingNumpy()
+        if backend in ("python", "numpy"):
+            return "python", PolynomialRing()
+        raise ValueError(
+            f"Unknown backend {backend}, expected 'python' or 'numpy'"
+        )
+
     def _ek_size(self) -> int:
         """
         Return the size of the encapsulation key for the selected paramters.
@@ -75,26 +178,21 @@ class ML_KEM:
             )
 
     @staticmethod
-    def _xof(b: bytes, i: bytes, j: bytes) -> bytes:
+    def _xof(b: bytes, i: bytes, j: bytes) -> Shake128Stream:
         """
         eXtendable-Output Function (XOF) described in 4.9 of FIPS 203 (page 19)
 
         NOTE:
-          We use hashlib's ``shake_128`` implementation, which does not support
-          an easy XOF interface, so we take the "easy" option and request a
-          fixed number of 840 bytes (5 invocations of Keccak), rather than
-          creating a byte stream.
-
-          If your code crashes because of too few bytes, you can get dinner at:
-          Casa de Chá da Boa Nova
-          https://cryptojedi.org/papers/terminate-20230516.pdf
+          The output is returned as a stream, which squeezes hashlib's
+          ``shake_128`` in blocks of 168 bytes as they are needed by the
+          sampler, see :py:class:`Shake128Stream`.
         """
         input_bytes = b + i + j
         if len(input_bytes) != 34:
             raise ValueError(
                 "Input bytes should be one 32 byte array and 2 single bytes."
             )
-        return shake_128(input_bytes).digest(840)
+        return Shake128Stream(input_bytes)
 
     @staticmethod
     def _prf(eta: int, s: bytes, b: bytes) -> bytes:
@@ -130,6 +228,25 @@ class ML_KEM:
         h = sha3_512(s).digest()
         return h[:32], h[32:]
 
+    def _sample_matrix_row(
+        self, rho_state, i: int, transpose: bool = False
+    ) -> list[PolynomialNTT]:
+        """
+        Helper function which samples the row `i` of the matrix generated
+        from the seed absorbed in `rho_state`, or of its transpose when
+        `transpose` is set to True.
+        """
+        # The hash state is copied for each entry, which is equivalent to
+        # ``self._xof(rho, j, i)`` for the entry (i, j) of the matrix
+        if transpose:
+            seeds = [bytes([i, j]) for j in range(self.k)]
+        else:
+            seeds = [bytes([j, i]) for j in range(self.k)]
+        return [
+            self.R.ntt_sample(Shake128Stream(seed, state=rho_state))
+            for seed in seeds
+        ]
+
     def _generate_matrix_from_seed(
         self, rho: bytes, transpose: bool = False
     ) -> Matrix:
@@ -140,41 +257,49 @@ class ML_KEM:
         When `transpose` is set to True, the matrix A is
         built as the transpose.
         """
+        # The seed is absorbed once, and the rows are sampled in the order
+        # of the matrix built, rather than as a transposed view
+        rho_state = shake_128(rho)
         A_data = [
-            [self.R.zero() for _ in range(self.k)] for _ in range(self.k)
+            self._sample_matrix_row(rho_state, i, transpose)
+            for i in range(self.k)
         ]
-        for i in range(self.k):
-            for j in range(self.k):
-                xof_bytes = self._xof(rho, bytes([j]), bytes([i]))
-                A_data[i][j] = self.R.ntt_sample(xof_bytes)
-        A_hat = self.M(A_data, transpose=transpose)
+        A_hat = self.M(A_data)
         return A_hat
 
-    def _generate_error_vector(
-        self, sigma: bytes, eta: int, N: int
-    ) -> tuple[Vector, int]:
-        """
-        Helper function which generates a element in the
-        module from the Centered Binomial Distribution.
-        """
-        elements = [self.R.zero() for _ in range(self.k)]
-        for i in range(self.k):
-            prf_output = self._prf(eta, sigma, bytes([N]))
-            elements[i] = self.R.cbd(prf_output, eta)
-            N += 1
-        v = self.M.vector(elements)
-        return v, N
-
-    def _generate_polynomial(
-        self, sigma: bytes, eta: int, N: int
-    ) -> tuple[Polynomial, int]:
-        """
-        Helper function which generates a element in the
-        polynomial ring from the Centered Binomial Distribution.
-        """
-        prf_output = self._prf(eta, sigma, bytes([N]))
-        p = self.R.cbd(prf_output, eta)
-        return p, N + 1
+    def _matrix_vector_from_seed(
+        self,
+        rho: bytes,
+        v_hat: Vector,
+        transpose: bool = False,
+        acc: Optional[Vector] = None,
+    ) -> Vector:
+        """
+        Helper function which computes the product of the matrix generated
+        from the seed `rho` (or its transpose) with the vector `v_hat`, in
+        the NTT domain.
+
+        Each row of the matrix is sampled and immediately accumulated into
+        an element of the product, so at most one row is held at a time.
+        When `acc` is given, the product is added to its elements in place.
+        """
+        rho_state = shake_128(rho)
+        v_elements = v_hat._elements()
+        mul_acc = self.R.element_ntt.multiply_accumulate
+        if acc is None:
+            return self.M.vector(
+                [
+                    mul_acc(
+                        self._sample_matrix_row(rho_state, i, transpose),
+                        v_elements,
+                    )
+                    for i in range(self.k)
+                ]
+            )
+        for i, ele in enumerate(acc._elements()):
+            row = self._sample_matrix_row(rho_state, i, transpose)
+            ele.mul_acc_inplace(row, v_elements)
+        return acc
 
     def _k_pke_keygen(self, d: bytes) -> tuple[bytes, bytes]:
         """
@@ -184,47 +309,61 @@ class ML_KEM:
         :return: Tuple with encryption key and decryption key.
         :rtype: tuple(bytes, bytes)
         """
+        return self._k_pke_keygen_batch([d])[0]
+
+    def _k_pke_keygen_batch(
+        self, ds: list[bytes]
+    ) -> list[tuple[bytes, bytes]]:
+        """
+        Generate an encryption key and a corresponding decryption key from
+        each of the seeds ``ds`` following Algorithm 13 (FIPS 203), with
+        each stage performed for all keys before the next.
+
+        :return: List of tuples with encryption key and decryption key.
+        :rtype: list(tuple(bytes, bytes))
+        """
+        if not ds:
+            return []
+
         # Expand 32 + 1 bytes to two 32-byte seeds. Note that the
         # inclusion of the lattice parameter here is for domain
         # separation between different parameter sets
-        rho, sigma = self._G(d + bytes([self.k]))
-
-        # Generate A_hat from seed rho
-        A_hat = self._generate_matrix_from_seed(rho)
-
-        # Set counter for PRF
-        N = 0
+        seeds = [self._G(d + bytes([self.k])) for d in ds]
 
-        # Generate the error vector s ∈ R^k
-        s, N = self._generate_error_vector(sigma, self.eta_1, N)
+        # Generate the vectors s, e ∈ R^k of every key from the PRF with the
+        # counter N running from 0 to 2k - 1, all sampled straight into NTT
+        # form as a single batch
+        k = self.k
+        inputs = []
+        for _, sigma in seeds:
+            inputs += CBDSampler(self.R, sigma).draw_bytes(self.eta_1, 2 * k)
+        polys = self.R.cbd_to_ntt_batch(inputs, self.eta_1)
 
-        # Generate the error vector e ∈ R^k
-        e, N = self._generate_error_vector(sigma, self.eta_1, N)
+        keys = []
+        for i, (rho, _) in enumerate(seeds):
+            s_hat = self.M.vector(polys[2 * k * i : 2 * k * i + k])
+            e_hat = self.M.vector(polys[2 * k * i + k : 2 * k * (i + 1)])
 
-        # Compute public value (in NTT form)
-        s_hat = s.to_ntt()
-        e_hat = e.to_ntt()
-        t_hat = A_hat @ s_hat + e_hat
+            # Compute A_hat @ s_hat + e_hat, sampling A_hat from the seed rho
+            # one row at a time, and accumulating into the elements of e_hat
+            t_hat = self._matrix_vector_from_seed(rho, s_hat, acc=e_hat)
 
-        # Byte encode
-        ek_pke = t_hat.encode(12) + rho
-        dk_pke = s_hat.encode(12)
+            # Byte encode
+            ek_pke = t_hat.encode(12) + rho
+            dk_pke = s_hat.encode(12)
+            keys.append((ek_pke, dk_pke))
 
-        return (ek_pke, dk_pke)
+        return keys
 
-    def _k_pke_encrypt(self, ek_pke: bytes, m: bytes, r: bytes) -> bytes:
+    def _k_pke_decode_ek(self, ek_pke: bytes) -> tuple[Vector, bytes]:
         """
-        Uses the encryption key to encrypt a plaintext message using the
-        randomness r following Algorithm 14 (FIPS 203)
-
-        As well as performing the usual pke encryption, the FIPS document
-        requires two additional checks.
+        Decode the encryption key into the vector t_hat and the seed rho,
+        performing the two checks FIPS 203 requires of the key.
 
         1. Type Check: The ek_pke is of the expected length
         2. Modulus Check: That t_hat has been canonically encoded
 
-        These are performed in this function and a ``ValueError`` is raised if
-        either fails.
+        A ``ValueError`` is raised if either fails.
         """
         # First check if the encap key has the right length
         if len(ek_pke) != self._ek_size():
@@ -243,44 +382,157 @@ class ML_KEM:
             raise ValueError(
                 "Modulus check failed, t_hat does not encode correctly"
             )
+        return t_hat, rho
 
-        # Generate A_hat^T from seed rho
-        A_hat_T = self._generate_matrix_from_seed(rho, transpose=True)
-
-        N = 0
-        y, N = self._generate_error_vector(r, self.eta_1, N)
-        e1, N = self._generate_error_vector(r, self.eta_2, N)
-        e2, N = self._generate_polynomial(r, self.eta_2, N)
-
-        y_hat = y.to_ntt()
-
-        u = (A_hat_T @ y_hat).from_ntt() + e1
-
-        mu = self.R.decode(m, 1).decompress(1)
-        v = t_hat.dot(y_hat).from_ntt() + e2 + mu
-
-        c1 = u.compress(self.du).encode(self.du)
-        c2 = v.compress(self.dv).encode(self.dv)
+    def _k_pke_encrypt(self, ek_pke: bytes, m: bytes, r: bytes) -> bytes:
+        """
+        Uses the encryption key to encrypt a plaintext message using the
+        randomness r following Algorithm 14 (FIPS 203)
 
-        return c1 + c2
+        As well as performing the usual pke encryption, the FIPS document
+        requires two additional checks, which are performed when decoding
+        the key, see :py:meth:`_k_pke_decode_ek`.
+        """
+        t_hat, rho = self._k_pke_decode_ek(ek_pke)
+
+        # Generate A_hat^T from seed rho when it is cached, otherwise it is
+        # streamed from the seed while computing A_hat^T @ y_hat
+        A_hat_T = None
+        if self.matrix_cache is not None:
+            A_hat_T = self._cached_matrix_from_seed(rho, transpose=True)
+
+        return self._k_pke_encrypt_decoded(t_hat, A_hat_T, m, r, rho)
+
+    def _k_pke_encrypt_decoded(
+        self,
+        t_hat: Vector,
+        A_hat_T: Optional[Matrix],
+        m: bytes,
+        r: bytes,
+        rho: Optional[bytes] = None,
+    ) -> bytes:
+        """
+        Encrypt a plaintext message using the randomness r following
+        Algorithm 14 (FIPS 203), with the encryption key already decoded
+        into t_hat and the matrix A_hat^T. Neither are modified.
+
+        When A_hat_T is None, the matrix is sampled from the seed rho one
+        row at a time instead.
+        """
+        return self._k_pke_encrypt_batch([(t_hat, A_hat_T, rho)], [m], [r])[0]
+
+    def _k_pke_encrypt_batch(
+        self,
+        keys: list[tuple[Vector, Optional[Matrix], Optional[bytes]]],
+        ms: list[bytes],
+        rs: list[bytes],
+    ) -> list[bytes]:
+        """
+        Encrypt each plaintext message of ``ms`` using the randomness of
+        ``rs`` following Algorithm 14 (FIPS 203), under the corresponding
+        decoded encryption key of ``keys``, see
+        :py:meth:`_k_pke_encrypt_decoded`. Keys are given as tuples
+        ``(t_hat, A_hat_T, rho)`` and are not modified.
+
+        The sampling of y and the NTTs of all messages are each performed
+        as a single batch.
+        """
+        if not ms:
+            return []
+        k = self.k
+
+        # Generate y, e1 ∈ R^k and e2 ∈ R for every message from the PRF
+        # with the counter N running from 0 to 2k, with y of all messages
+        # sampled straight into NTT form as one batch
+        y_inputs, errors = [], []
+        for r in rs:
+            sampler = CBDSampler(self.R, r)
+            y_inputs += sampler.draw_bytes(self.eta_1, k)
+            errors += sampler.draw([(self.eta_2, k + 1, False)])
+        y_polys = self.R.cbd_to_ntt_batch(y_inputs, self.eta_1)
+
+        # Compute A_hat^T @ y_hat and t_hat . y_hat for every message, which
+        # are then taken out of the NTT domain as one batch
+        products = []
+        for i, (t_hat, A_hat_T, rho) in enumerate(keys):
+            y_hat = self.M.vector(y_polys[k * i : k * (i + 1)])
+            if A_hat_T is None:
+                u_hat = self._matrix_vector_from_seed(
+                    rho, y_hat, transpose=True
+                )
+            else:
+                u_hat = A_hat_T @ y_hat
+            products += u_hat._elements()
+            products.append(t_hat.dot(y_hat))
+        products = self.R.from_ntt_batch(products)
+
+        # The sums are computed in place
+        ciphertexts = []
+        for i, (m, e) in enumerate(zip(ms, errors)):
+            u = products[(k + 1) * i : (k + 1) * i + k]
+            for f, g in zip(u, e):
+                f.add_inplace(g)
+            u = self.M.vector(u)
+
+            mu = self.R.decode_decompress(m, 1)
+            v = products[(k + 1) * i + k].add_inplace(e[k]).add_inplace(mu)
+
+            c1 = u.compress_encode(self.du)
+            c2 = v.compress_encode(self.dv)
+            ciphertexts.append(c1 + c2)
+
+        return ciphertexts
 
     def _k_pke_decrypt(self, dk_pke: bytes, c: bytes) -> bytes:
         """
         Uses the decryption key to decrypt a ciphertext following
         Algorithm 15 (FIPS 203)
         """
-        n = self.k * self.du * 32
-        c1, c2 = c[:n], c[n:]
-
-        u = self.M.decode_vector(c1, self.k, self.du).decompress(self.du)
-        v = self.R.decode(c2, self.dv).decompress(self.dv)
         s_hat = self.M.decode_vector(dk_pke, self.k, 12, is_ntt=True)
+        return self._k_pke_decrypt_decoded(s_hat, c)
+
+    def _k_pke_decrypt_decoded(self, s_hat: Vector, c: bytes) -> bytes:
+        """
+        Decrypt a ciphertext following Algorithm 15 (FIPS 203), with the
+        decryption key already decoded into s_hat, which is not modified.
+        """
+        return self._k_pke_decrypt_batch(s_hat, [c])[0]
+
+    def _k_pke_decrypt_batch(
+        self, s_hat: Vector, cs: list[bytes]
+    ) -> list[bytes]:
+        """
+        Decrypt each ciphertext of ``cs`` following Algorithm 15 (FIPS 203)
+        with the decryption key decoded into s_hat, which is not modified.
+
+        The NTTs of the vectors u of all ciphertexts, and the inverse NTTs
+        of the products s_hat . u_hat, are each performed as one batch.
+        """
+        if not cs:
+            return []
+        k = self.k
+        n = k * self.du * 32
 
-        u_hat = u.to_ntt()
-        w = v - (s_hat.dot(u_hat)).from_ntt()
-        m = w.compress(1).encode(1)
+        us, vs = [], []
+        for c in cs:
+            c1, c2 = c[:n], c[n:]
+            u = self.M.decode_decompress_vector(c1, k, self.du)
+            us += u._elements()
+            vs.append(self.R.decode_decompress(c2, self.dv))
 
-        return m
+        u_hats = self.R.to_ntt_batch(us)
+        s_elements = s_hat._elements()
+        mul_acc = self.R.element_ntt.multiply_accumulate
+        products = self.R.from_ntt_batch(
+            [
+                mul_acc(s_elements, u_hats[k * i : k * (i + 1)])
+                for i in range(len(cs))
+            ]
+        )
+
+        return [
+            v.sub_inplace(p).compress_encode(1) for v, p in zip(vs, products)
+        ]
 
     def _keygen_internal(self, d: bytes, z: bytes) -> tuple[bytes, bytes]:
         """
@@ -290,12 +542,26 @@ class ML_KEM:
         :return: Tuple with encapsulation key and decapsulation key.
         :rtype: tuple(bytes, bytes)
         """
-        ek_pke, dk_pke = self._k_pke_keygen(d)
+        return self._keygen_internal_batch([d], [z])[0]
 
-        ek = ek_pke
-        dk = dk_pke + ek + self._H(ek) + z
+    def _keygen_internal_batch(
+        self, ds: list[bytes], zs: list[bytes]
+    ) -> list[tuple[bytes, bytes]]:
+        """
+        Use randomness to generate an encapsulation key and a corresponding
+        decapsulation key for each pair of ``ds`` and ``zs`` following
+        Algorithm 16 (FIPS 203)
 
-        return (ek, dk)
+        :return: List of tuples with encapsulation key and decapsulation key.
+        :rtype: list(tuple(bytes, bytes))
+        """
+        keys = []
+        for (ek_pke, dk_pke), z in zip(self._k_pke_keygen_batch(ds), zs):
+            ek = ek_pke
+            dk = dk_pke + ek + self._H(ek) + z
+            keys.append((ek, dk))
+
+        return keys
 
     def keygen(self) -> tuple[bytes, bytes]:
         """
@@ -338,33 +604,148 @@ class ML_KEM:
         ek, dk = self._keygen_internal(d, z)
         return (ek, dk)
 
-    def _encaps_internal(self, ek: bytes, m: bytes) -> tuple[bytes, bytes]:
+    def keygen_batch(self, n: int) -> list[tuple[bytes, bytes]]:
+        """
+        Generate ``n`` encapsulation keys and corresponding decapsulation
+        keys following Algorithm 19 (FIPS 203)
+
+        The randomness is drawn as by ``n`` calls to :py:meth:`keygen`, which
+        give the same keys, but the sampling and transforms of the secrets
+        of all keys are performed together.
+
+        :return: List of tuples with encapsulation key and decapsulation key.
+        :rtype: list(tuple(bytes, bytes))
+        """
+        ds, zs = [], []
+        for _ in range(n):
+            ds.append(self.random_bytes(32))
+            zs.append(self.random_bytes(32))
+        return self._keygen_internal_batch(ds, zs)
+
+    def key_derive_batch(
+        self, seeds: list[bytes]
+    ) -> list[tuple[bytes, bytes]]:
+        """
+        Derive an encapsulation key and corresponding decapsulation key from
+        each seed, as :py:meth:`key_derive` does, with the sampling and
+        transforms of the secrets of all keys performed together.
+
+        :return: List of tuples with encapsulation key and decapsulation key.
+        :rtype: list(tuple(bytes, bytes))
+        """
+        if any(len(seed) != 64 for seed in seeds):
+            raise ValueError("The seed must be 64 bytes long")
+
+        ds = [seed[:32] for seed in seeds]
+        zs = [seed[32:] for seed in seeds]
+        return self._keygen_internal_batch(ds, zs)
+
+    def load_encapsulation_key(self, ek: bytes) -> EncapsulationKey:
+        """
+        Validate and decode an encapsulation key once, for encapsulating
+        to the same key many times.
+
+        The type and modulus checks of FIPS 203 are performed, and the
+        returned key holds the decoded ``t_hat``, the matrix ``A_hat_T``
+        expanded from its seed and the hash ``H(ek)``. It may be passed to
+        :py:meth:`encaps` of this instance in place of ``ek``.
+
+        :param bytes ek: byte-encoded encapsulation key
+        :return: the validated and decoded encapsulation key
+        :rtype: EncapsulationKey
+        """
+        ek = bytes(ek)
+        try:
+            t_hat, rho = self._k_pke_decode_ek(ek)
+        except ValueError as e:
+            raise ValueError(f"Validation of encapsulation key failed: {e = }")
+        A_hat_T = self._generate_matrix_from_seed(rho, transpose=True)
+        return EncapsulationKey(
+            self, ek, t_hat.compact(), A_hat_T.compact(), self._H(ek)
+        )
+
+    def _encaps_internal(
+        self, ek: Union[bytes, EncapsulationKey], m: bytes
+    ) -> tuple[bytes, bytes]:
         """
         Uses the encapsulation key and randomness to generate a key and an
         associated ciphertext following Algorithm 17 (FIPS 203)
 
-        :param bytes ek: byte-encoded encapsulation key
+        :param ek: byte-encoded or loaded encapsulation key
+        :type ek: bytes or EncapsulationKey
         :return: a random key and an encapsulation of it
         :rtype: tuple(bytes, bytes)
         """
-        K, r = self._G(m + self._H(ek))
+        return self._encaps_internal_batch([ek], [m])[0]
+
+    def _encaps_internal_batch(
+        self, eks: list[Union[bytes, EncapsulationKey]], ms: list[bytes]
+    ) -> list[tuple[bytes, bytes]]:
+        """
+        Uses each encapsulation key of ``eks`` with the corresponding
+        randomness of ``ms`` to generate a key and an associated ciphertext
+        following Algorithm 17 (FIPS 203), see
+        :py:meth:`_k_pke_encrypt_batch`
 
+        :param eks: byte-encoded or loaded encapsulation keys
+        :type eks: list(bytes or EncapsulationKey)
+        :return: a list of random keys and their encapsulations
+        :rtype: list(tuple(bytes, bytes))
+        """
         # NOTE: ML-KEM requires input validation before returning the result of
         # encapsulation. These are performed by the following two checks:
         #
         # 1) Type check: the byte length of ek must be correct: 384*k + 32
         # 2) Modulus check: Encode(Decode(ek[0:384*k])) must be correct
         #
-        # As the modulus is decoded within the pke_encrypt, the design choice
-        # here is to do both of these checks within the k-pke call.
-        try:
-            c = self._k_pke_encrypt(ek, m, r)
-        except ValueError as e:
-            raise ValueError(f"Validation of encapsulation key failed: {e = }")
+        # These are performed when decoding the keys, and all keys are
+        # validated before any encapsulation. A loaded key has been
+        # validated and decoded already, see `load_encapsulation_key()`
+        keys, hashes = [], []
+        for ek in eks:
+            if isinstance(ek, EncapsulationKey):
+                if ek.kem is not self:
+                    raise ValueError(
+                        "The encapsulation key was loaded by another instance"
+                    )
+                keys.append((ek._t_hat, ek._A_hat_T, None))
+                hashes.append(ek.h)
+                continue
+            try:
+                t_hat, rho = self._k_pke_decode_ek(ek)
+            except ValueError as e:
+                raise ValueError(
+                    f"Validation of encapsulation key failed: {e = }"
+                )
+            keys.append((t_hat, None, rho))
+            hashes.append(self._H(ek))
+
+        # A_hat^T is taken from the cache when it is enabled, and otherwise
+        # expanded once for each seed rho shared by several keys of the
+        # batch, with the remaining matrices streamed from their seed
+        rhos = Counter(rho for _, _, rho in keys if rho is not None)
+        matrices = {
+            rho: self._cached_matrix_from_seed(rho, transpose=True)
+            for rho, count in rhos.items()
+            if count > 1 or self.matrix_cache is not None
+        }
+        keys = [
+            (t_hat, matrices.get(rho, A_hat_T), rho)
+            for t_hat, A_hat_T, rho in keys
+        ]
 
-        return K, c
+        Ks, rs = [], []
+        for m, h in zip(ms, hashes):
+            K, r = self._G(m + h)
+            Ks.append(K)
+            rs.append(r)
+        cs = self._k_pke_encrypt_batch(keys, ms, rs)
+
+        return list(zip(Ks, cs))
 
-    def encaps(self, ek: bytes) -> tuple[bytes, bytes]:
+    def encaps(
+        self, ek: Union[bytes, EncapsulationKey]
+    ) -> tuple[bytes, bytes]:
         """
         Uses the encapsulation key to generate a shared secret key and an
         associated ciphertext following Algorithm 20 (FIPS 203)
@@ -374,7 +755,9 @@ class ML_KEM:
 
         Part of stable API.
 
-        :param bytes ek: byte-encoded encapsulation key
+        :param ek: byte-encoded encapsulation key, or one loaded with
+            :py:meth:`load_encapsulation_key`
+        :type ek: bytes or EncapsulationKey
         :return: a random key (``K``) and an encapsulation of it (``c``)
         :rtype: tuple(bytes, bytes)
         """
@@ -383,28 +766,46 @@ class ML_KEM:
         K, c = self._encaps_internal(ek, m)
         return K, c
 
-    def _decaps_internal(self, dk: bytes, c: bytes) -> bytes:
+    def encaps_batch(
+        self, eks: list[Union[bytes, EncapsulationKey]]
+    ) -> list[tuple[bytes, bytes]]:
         """
-        Uses the decapsulation key to produce a shared secret key from a
-        ciphertext following Algorithm 18 (FIPS 203)
+        Uses each encapsulation key to generate a shared secret key and an
+        associated ciphertext following Algorithm 20 (FIPS 203), as
+        :py:meth:`encaps` does for each key in turn.
 
-        :param bytes c: ciphertext with an encapsulated key
-        :param bytes dk: decapsulation key
-        :return: decapsulated key
-        :rtype: bytes
+        All keys are validated before any encapsulation. The sampling and
+        the NTTs for all keys are performed as batches, and the matrix of
+        a key which appears more than once is expanded once.
+
+        :param eks: byte-encoded encapsulation keys, or keys loaded with
+            :py:meth:`load_encapsulation_key`
+        :type eks: list(bytes or EncapsulationKey)
+        :return: a list of random keys (``K``) and their encapsulations
+            (``c``)
+        :rtype: list(tuple(bytes, bytes))
         """
-        # NOTE: ML-KEM requires input validation before returning the result of
-        # decapsulation. These are performed by the following three checks:
-        #
-        # 1) Ciphertext type check: the byte length of c must be correct
-        # 2) Decapsulation type check: the byte length of dk must be correct
-        # 3) Hash check: a hash of the internals of the dk must match
+        # Create random tokens
+        ms = [self.random_bytes(32) for _ in eks]
+        return self._encaps_internal_batch(eks, ms)
 
-        # Unlike encaps, these are easily performed in the kem decaps
+    def _check_ciphertext(self, c: bytes):
+        """
+        Perform the ciphertext type check of FIPS 203, raising a
+        ``ValueError`` when the ciphertext has the wrong length
+        """
         if len(c) != 32 * (self.du * self.k + self.dv):
             raise ValueError(
                 f"ciphertext type check failed. Expected {32 * (self.du * self.k + self.dv)} bytes and obtained {len(c)}"
             )
+
+    def _parse_dk(self, dk: bytes) -> tuple[bytes, bytes, bytes, bytes]:
+        """
+        Split the decapsulation key into dk_pke, ek_pke, h and z, performing
+        the decapsulation type check and the hash check of FIPS 203.
+
+        A ``ValueError`` is raised if either fails.
+        """
         if len(dk) != self._dk_size():
             raise ValueError(
                 f"decapsulation type check failed. Expected {self._dk_size()} bytes and obtained {len(dk)}"
@@ -420,6 +821,68 @@ class ML_KEM:
         if self._H(ek_pke) != h:
             raise ValueError("hash check failed")
 
+        return dk_pke, ek_pke, h, z
+
+    def load_decapsulation_key(self, dk: bytes) -> DecapsulationKey:
+        """
+        Validate and decode a decapsulation key once, for decapsulating
+        many ciphertexts with the same key.
+
+        The type and hash checks of FIPS 203 are performed, and the
+        returned key holds the decoded ``s_hat`` and the encapsulation key
+        it contains, loaded as by :py:meth:`load_encapsulation_key` for the
+        re-encryption. It may be passed to :py:meth:`decaps` of this
+        instance in place of ``dk``.
+
+        :param bytes dk: decapsulation key
+        :return: the validated and decoded decapsulation key
+        :rtype: DecapsulationKey
+        """
+        dk = bytes(dk)
+        try:
+            dk_pke, ek_pke, _, z = self._parse_dk(dk)
+            t_hat, rho = self._k_pke_decode_ek(ek_pke)
+        except ValueError as e:
+            raise ValueError(f"Validation of decapsulation key failed: {e = }")
+        s_hat = self.M.decode_vector(dk_pke, self.k, 12, is_ntt=True)
+        A_hat_T = self._generate_matrix_from_seed(rho, transpose=True)
+        ek = EncapsulationKey(
+            self, ek_pke, t_hat.compact(), A_hat_T.compact(), self._H(ek_pke)
+        )
+        return DecapsulationKey(self, dk, s_hat.compact(), ek, z)
+
+    def _decaps_internal(
+        self, dk: Union[bytes, DecapsulationKey], c: bytes
+    ) -> bytes:
+        """
+        Uses the decapsulation key to produce a shared secret key from a
+        ciphertext following Algorithm 18 (FIPS 203)
+
+        :param bytes c: ciphertext with an encapsulated key
+        :param dk: decapsulation key, or one loaded with
+            :py:meth:`load_decapsulation_key`
+        :type dk: bytes or DecapsulationKey
+        :return: decapsulated key
+        :rtype: bytes
+        """
+        # NOTE: ML-KEM requires input validation before returning the result of
+        # decapsulation. These are performed by the following three checks:
+        #
+        # 1) Ciphertext type check: the byte length of c must be correct
+        # 2) Decapsulation type check: the byte length of dk must be correct
+        # 3) Hash check: a hash of the internals of the dk must match
+        #
+        # For a loaded key, the last two were performed when loading it.
+        self._check_ciphertext(c)
+        if isinstance(dk, DecapsulationKey):
+            if dk.kem is not self:
+                raise ValueError(
+                    "The decapsulation key was loaded by another instance"
+                )
+            return self._decaps_decoded_batch(dk, [c])[0]
+
+        dk_pke, ek_pke, h, z = self._parse_dk(dk)
+
         # Decrypt the ciphertext
         m_prime = self._k_pke_decrypt(dk_pke, c)
 
@@ -438,7 +901,42 @@ class ML_KEM:
         # performed in constant time
         return select_bytes(K_bar, K_prime, c == c_prime)
 
-    def decaps(self, dk: bytes, c: bytes) -> bytes:
+    def _decaps_decoded_batch(
+        self, dk: DecapsulationKey, cs: list[bytes]
+    ) -> list[bytes]:
+        """
+        Produce the shared secret key of each ciphertext of ``cs``, which
+        must have passed the ciphertext type check, with the loaded key
+        ``dk`` following Algorithm 18 (FIPS 203)
+
+        The decryptions and re-encryptions of all ciphertexts are performed
+        as batches, see :py:meth:`_k_pke_decrypt_batch` and
+        :py:meth:`_k_pke_encrypt_batch`.
+        """
+        ek = dk.ek
+
+        # Decrypt the ciphertexts
+        m_primes = self._k_pke_decrypt_batch(dk._s_hat, cs)
+
+        # Re-encrypt the recovered messages
+        K_primes, r_primes = [], []
+        for m_prime in m_primes:
+            K_prime, r_prime = self._G(m_prime + ek.h)
+            K_primes.append(K_prime)
+            r_primes.append(r_prime)
+        keys = [(ek._t_hat, ek._A_hat_T, None)] * len(cs)
+        c_primes = self._k_pke_encrypt_batch(keys, m_primes, r_primes)
+
+        # If c != c_prime, return K_bar as garbage
+        # WARNING: for proper implementations, it is absolutely
+        # vital that the selection between the key and garbage is
+        # performed in constant time
+        return [
+            select_bytes(self._J(dk.z + c), K_prime, c == c_prime)
+            for c, K_prime, c_prime in zip(cs, K_primes, c_primes)
+        ]
+
+    def decaps(self, dk: Union[bytes, DecapsulationKey], c: bytes) -> bytes:
         """
         Uses the decapsulation key to produce a shared secret key from a
         ciphertext following Algorithm 21 (FIPS 203).
@@ -447,7 +945,9 @@ class ML_KEM:
 
         Part of stable API.
 
-        :param bytes dk: decapsulation key
+        :param dk: decapsulation key, or one loaded with
+            :py:meth:`load_decapsulation_key`
+        :type dk: bytes or DecapsulationKey
         :param bytes c: ciphertext with an encapsulated key
         :return: shared secret key (``K``)
         :rtype: bytes
@@ -459,3 +959,48 @@ class ML_KEM:
                 f"Validation of decapsulation key or ciphertext failed: {e = }"
             )
         return K_prime
+
+    def decaps_batch(
+        self, dk: Union[bytes, DecapsulationKey], cs: list[bytes]
+    ) -> list[Union[bytes, ValueError]]:
+        """
+        Uses the decapsulation key to produce a shared secret key from each
+        ciphertext following Algorithm 21 (FIPS 203), as :py:meth:`decaps`
+        does for each ciphertext in turn.
+
+        The key is validated and decoded once, as by
+        :py:meth:`load_decapsulation_key`, and a ``ValueError`` is raised if
+        it is invalid. A ciphertext which fails the type check does not
+        abort the batch, instead the ``ValueError`` :py:meth:`decaps` would
+        raise for it is returned in its place.
+
+        :param dk: decapsulation key, or one loaded with
+            :py:meth:`load_decapsulation_key`
+        :type dk: bytes or DecapsulationKey
+        :param list cs: ciphertexts with encapsulated keys
+        :return: the shared secret key (``K``) or error of each ciphertext
+        :rtype: list(bytes or ValueError)
+        """
+        if not isinstance(dk, DecapsulationKey):
+            dk = self.load_decapsulation_key(dk)
+        elif dk.kem is not self:
+            raise ValueError(
+                "The decapsulation key was loaded by another instance"
+            )
+
+        results = [None] * len(cs)
+        valid = []
+        for i, c in enumerate(cs):
+            try:
+                self._check_ciphertext(c)
+            except ValueError as e:
+                results[i] = ValueError(
+                    f"Validation of decapsulation key or ciphertext failed: {e = }"
+                )
+                continue
+            valid.append(i)
+
+        Ks = self._decaps_decoded_batch(dk, [cs[i] for i in valid])
+        for i, K in zip(valid, Ks):
+            results[i] = K
+        return results
@@ -0,0 +1,184 @@
+"""
+Bulk ML-KEM operations spread over the cores of a host.
+
+The arithmetic of :py:class:`~kyber_py.ml_kem.ml_kem.ML_KEM` is bound by the
+GIL, so :py:class:`ParallelML_KEM` runs it in a pool of worker processes,
+each holding its own ``ML_KEM`` object, and splits bulk work into chunks
+which are processed with the batch methods of ``ML_KEM``.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from .ml_kem import ML_KEM
+
+# The ML_KEM object of a worker process, built once by `_init_worker()`
+_worker_kem = None
+
+
+def _init_worker(params, backend):
+    """
+    Build the ML_KEM object of a worker process, including the lookup
+    tables of its polynomial ring which are otherwise built on first use
+    """
+    global _worker_kem
+    _worker_kem = ML_KEM(params, backend)
+    R = _worker_kem.R
+    for d in {1, _worker_kem.du, _worker_kem.dv}:
+        R._compress_table(d)
+        R._decompress_table(d)
+
+
+def _worker_call(method, *args):
+    """
+    Call a method of the ML_KEM object of the worker process
+    """
+    return getattr(_worker_kem, method)(*args)
+
+
+def _keygen_chunk(n):
+    return _worker_kem.keygen_batch(n)
+
+
+def _key_derive_chunk(seeds):
+    return _worker_kem.key_derive_batch(seeds)
+
+
+def _encaps_chunk(eks):
+    return _worker_kem.encaps_batch(eks)
+
+
+def _decaps_chunk(dk, cs):
+    return _worker_kem.decaps_batch(dk, cs)
+
+
+class ParallelML_KEM:
+    """
+    Perform bulk ML-KEM operations with a pool of worker processes, see
+    :py:class:`concurrent.futures.ProcessPoolExecutor`.
+
+    Work is split into chunks of at most ``chunksize`` items, which are
+    processed by the workers with the batch methods of ``ML_KEM``, and the
+    results are returned in the order of the inputs. By default the work is
+    split into four chunks per worker.
+
+    The randomness of every worker is drawn from :func:`os.urandom()`.
+
+    The pool is shut down by :py:meth:`close`, or when the object is used
+    as a context manager, on leaving the ``with`` block.
+
+    :param dict params: the lattice parameters, see
+        :py:data:`~kyber_py.ml_kem.default_parameters.DEFAULT_PARAMETERS`
+    :param str backend: the polynomial arithmetic backend of the workers
+    :param int max_workers: the number of worker processes, by default the
+        number of CPUs
+    :param int chunksize: the maximum number of items sent to a worker at
+        once
+    :param mp_context: the multiprocessing context used to start the
+        workers
+    """
+
+    def __init__(
+        self,
+        params,
+        backend="python",
+        max_workers=None,
+        chunksize=None,
+        mp_context=None,
+    ):
+        if chunksize is not None and chunksize < 1:
+            raise ValueError("The chunk size must be positive")
+        self.params = params
+        self.backend = backend
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self._executor = ProcessPoolExecutor(
+            self.max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(params, backend),
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Shut down the worker processes, waiting for pending work to finish
+        """
+        self._executor.shutdown(wait=True)
+
+    def _chunks(self, items):
+        """
+        Split a list of items into consecutive chunks
+        """
+        size = self.chunksize
+        if size is None:
+            size = max(1, -(-len(items) // (4 * self.max_workers)))
+        return [items[i : i + size] for i in range(0, len(items), size)]
+
+    def _map(self, fn, chunks, *args):
+        """
+        Apply ``fn`` to every chunk in the workers, and concatenate the
+        results in order
+        """
+        if args:
+            futures = [self._executor.submit(fn, *args, c) for c in chunks]
+        else:
+            futures = [self._executor.submit(fn, c) for c in chunks]
+        return [result for future in futures for result in future.result()]
+
+    def keygen_many(self, n):
+        """
+        Generate ``n`` encapsulation keys and corresponding decapsulation
+        keys, see :py:meth:`~kyber_py.ml_kem.ml_kem.ML_KEM.keygen`
+
+        :return: List of tuples with encapsulation key and decapsulation key.
+        :rtype: list(tuple(bytes, bytes))
+        """
+        sizes = [len(chunk) for chunk in self._chunks(range(n))]
+        return self._map(_keygen_chunk, sizes)
+
+    def key_derive_many(self, seeds):
+        """
+        Derive an encapsulation key and corresponding decapsulation key from
+        each seed, see
+        :py:meth:`~kyber_py.ml_kem.ml_kem.ML_KEM.key_derive`
+
+        :return: List of tuples with encapsulation key and decapsulation key.
+        :rtype: list(tuple(bytes, bytes))
+        """
+        return self._map(_key_derive_chunk, self._chunks(list(seeds)))
+
+    def encaps_many(self, eks):
+        """
+        Use each encapsulation key to generate a shared secret key and an
+        associated ciphertext, see
+        :py:meth:`~kyber_py.ml_kem.ml_kem.ML_KEM.encaps_batch`
+
+        Loaded keys are sent to the workers as bytes and are loaded again
+        there.
+
+        :param list eks: encapsulation keys
+        :return: a list of random keys (``K``) and their encapsulations
+            (``c``)
+        :rtype: list(tuple(bytes, bytes))
+        """
+        eks = [bytes(ek) for ek in eks]
+        return self._map(_encaps_chunk, self._chunks(eks))
+
+    def decaps_many(self, dk, cs):
+        """
+        Use the decapsulation key to produce a shared secret key from each
+        ciphertext, see
+        :py:meth:`~kyber_py.ml_kem.ml_kem.ML_KEM.decaps_batch`. Every
+        worker validates and decodes the key once per chunk.
+
+        :param bytes dk: decapsulation key
+        :param list cs: ciphertexts with encapsulated keys
+        :return: the shared secret key (``K``) or error of each ciphertext
+        :rtype: list(bytes or ValueError)
+        """
+        return self._map(_decaps_chunk, self._chunks(list(cs)), bytes(dk))
@@ -1,9 +1,12 @@
+import sys
 from typing import cast
 from ..polynomials.polynomials import PolynomialRing
 from .modules_generic import GenericModule, GenericMatrix
 
 
 class Matrix(GenericMatrix):
+    __slots__ = ()
+
     def __init__(self, parent, matrix_data, transpose=False):
         super().__init__(parent, matrix_data, transpose=transpose)
 
@@ -11,11 +14,41 @@ class Matrix(GenericMatrix):
         """
         Encode every element of a matrix into bytes and concatenate
         """
-        output = b""
+        return b"".join([ele.encode(d) for row in self._data for ele in row])
+
+    def compress_encode(self, d):
+        """
+        Compress and encode every element of the matrix into bytes and
+        concatenate, leaving the matrix unchanged
+        """
+        return b"".join(
+            [ele.compress_encode(d) for row in self._data for ele in row]
+        )
+
+    def compact(self):
+        """
+        Store the coefficients of every element of the matrix in a compact
+        array, see
+        :py:meth:`~kyber_py.polynomials.polynomials.Polynomial.compact`
+        """
+        for row in self._data:
+            for ele in row:
+                ele.compact()
+        return self
+
+    def nbytes(self):
+        """
+        Return the approximate memory in bytes taken by the coefficients of
+        the elements of the matrix
+        """
+        total = 0
         for row in self._data:
             for ele in row:
-                output += ele.encode(d)
-        return output
+                total += sys.getsizeof(ele.coeffs)
+                # The size of a NumPy view does not include its buffer
+                if getattr(ele.coeffs, "base", None) is not None:
+                    total += ele.coeffs.nbytes
+        return total
 
     def compress(self, d):
         """
@@ -36,29 +69,151 @@ class Matrix(GenericMatrix):
                 ele.decompress(d)
         return self
 
-    def to_ntt(self):
+    def _rows(self):
         """
-        Convert every element of the matrix into NTT form
+        Return the elements of the matrix as a list of rows
+        """
+        if not self._transpose:
+            return self._data
+        return list(zip(*self._data))
+
+    def _columns(self):
+        """
+        Return the elements of the matrix as a list of columns
+        """
+        if self._transpose:
+            return self._data
+        return list(zip(*self._data))
+
+    def __matmul__(self, other):
+        """
+        Denoted A @ B
+
+        When both matrices are in the NTT domain, every element of the
+        product is computed with a single fused multiply-accumulate, rather
+        than summing individually reduced products
+        """
+        return self.matmul(other)
+
+    def _is_ntt(self):
+        """
+        Return whether the elements of the matrix are in the NTT domain
+        """
+        return isinstance(self._data[0][0], self.parent.ring.element_ntt)
+
+    def _elements(self):
         """
-        data = [[x.to_ntt() for x in row] for row in self._data]
+        Return the elements of the matrix as a flat list, in row order
+        """
+        m, n = self.dim()
+        return [self[i, j] for i in range(m) for j in range(n)]
+
+    def _check_out(self, out, dim):
+        """
+        Ensure ``out`` is a matrix of the module of dimension ``dim``, and
+        return its elements as a flat list, in row order
+        """
+        if not isinstance(out, Matrix) or out.parent != self.parent:
+            raise TypeError("Output must be a matrix of the same module")
+        if out.dim() != dim:
+            raise ValueError("Output matrix has the wrong dimensions")
+        return out._elements()
+
+    def matmul(self, other, out=None):
+        """
+        Compute A @ B, optionally writing the result into the elements of the
+        matrix ``out``, which is only supported for matrices in the NTT
+        domain. The elements of ``out`` must not be elements of either
+        operand, as the operands are read while ``out`` is written.
+        """
+        if (
+            not isinstance(other, type(self))
+            or self.parent != other.parent
+            or self.dim()[1] != other.dim()[0]
+            or not self._is_ntt()
+            or not other._is_ntt()
+        ):
+            if out is not None:
+                raise TypeError(
+                    "Matrix multiplication with an output matrix is only supported in the NTT domain"
+                )
+            return super().__matmul__(other)
+
+        mul_acc = self.parent.ring.element_ntt.multiply_accumulate
+        columns = other._columns()
+        if out is None:
+            return self.parent(
+                [
+                    [mul_acc(row, col) for col in columns]
+                    for row in self._rows()
+                ]
+            )
+
+        targets = self._check_out(out, (self.dim()[0], len(columns)))
+        operands = {id(x) for x in self._elements() + other._elements()}
+        if any(id(x) in operands for x in targets):
+            raise ValueError(
+                "Output matrix must not share elements with A or B"
+            )
+        elements = iter(targets)
+        for row in self._rows():
+            for col in columns:
+                mul_acc(row, col, out=next(elements))
+        return out
+
+    def _unflatten(self, elements):
+        """
+        Reshape a flat list of elements into rows matching ``self._data``
+        """
+        n = len(self._data[0])
+        return [elements[i : i + n] for i in range(0, len(elements), n)]
+
+    def to_ntt(self, out=None):
+        """
+        Convert every element of the matrix into NTT form, with all elements
+        transformed as a single batch by the base ring. When ``out`` is given
+        the results are written into its elements rather than a new matrix.
+        """
+        if out is not None:
+            targets = self._check_out(out, self.dim())
+            self.parent.ring.to_ntt_batch(self._elements(), out=targets)
+            return out
+        elements = [x for row in self._data for x in row]
+        data = self._unflatten(self.parent.ring.to_ntt_batch(elements))
         return self.parent(data, transpose=self._transpose)
 
-    def from_ntt(self):
+    def from_ntt(self, out=None):
         """
-        Convert every element of the matrix from NTT form
+        Convert every element of the matrix from NTT form, with all elements
+        transformed as a single batch by the base ring. When ``out`` is given
+        the results are written into its elements rather than a new matrix.
         """
-        data = [[x.from_ntt() for x in row] for row in self._data]
+        if out is not None:
+            targets = self._check_out(out, self.dim())
+            self.parent.ring.from_ntt_batch(self._elements(), out=targets)
+            return out
+        elements = [x for row in self._data for x in row]
+        data = self._unflatten(self.parent.ring.from_ntt_batch(elements))
         return self.parent(data, transpose=self._transpose)
 
 
 class Vector(Matrix):
+    __slots__ = ()
+
     def __init__(self, parent, vector_elements):
         super().__init__(parent, [vector_elements], transpose=True)
 
 
 class Module(GenericModule):
-    def __init__(self):
-        self.ring = PolynomialRing()
+    def __init__(self, ring=None):
+        """
+        Initialise the module over the ML-KEM polynomial ring, by default the
+        pure-python :py:class:`PolynomialRing` is used, but any ring with the
+        same interface (such as the NumPy backed ring) can be supplied.
+        """
+        if ring is None:
+            ring = PolynomialRing()
+        self.ring = ring
         self.matrix = Matrix
 
     def __call__(self, matrix_elements, transpose=False) -> Matrix:
@@ -103,3 +258,11 @@ class Module(GenericModule):
         ]
 
         return self.vector(elements)
+
+    def decode_decompress_vector(self, input_bytes, k, d):
+        """
+        Decode bytes into a vector of ``k`` polynomials with ``d``-bit
+        coefficients and decompress every element, as used when parsing
+        ciphertexts
+        """
+        return self.decode_vector(input_bytes, k, d).decompress(d)
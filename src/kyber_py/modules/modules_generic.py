@@ -1,4 +1,6 @@
 class GenericMatrix:
+    __slots__ = ("parent", "_data", "_transpose")
+
     def __init__(self, parent, matrix_data, transpose=False):
         self.parent = parent
         self._data = matrix_data
@@ -116,6 +118,42 @@ class GenericMatrix:
         self = self - other
         return self
 
+    def _check_inplace(self, other):
+        """
+        Ensure ``other`` can be added to or subtracted from the matrix in
+        place
+        """
+        if not isinstance(other, type(self)):
+            raise TypeError("Can only add matrices to other matrices")
+        if self.parent != other.parent:
+            raise TypeError("Matrices must have the same base ring")
+        if self.dim() != other.dim():
+            raise ValueError("Matrices are not of the same dimensions")
+
+    def add_inplace(self, other):
+        """
+        Add ``other`` to the matrix in place, by adding to every element in
+        place, returning ``self``
+        """
+        self._check_inplace(other)
+        m, n = self.dim()
+        for i in range(m):
+            for j in range(n):
+                self[i, j].add_inplace(other[i, j])
+        return self
+
+    def sub_inplace(self, other):
+        """
+        Subtract ``other`` from the matrix in place, by subtracting from every
+        element in place, returning ``self``
+        """
+        self._check_inplace(other)
+        m, n = self.dim()
+        for i in range(m):
+            for j in range(n):
+                self[i, j].sub_inplace(other[i, j])
+        return self
+
     def __matmul__(self, other):
         """
         Denoted A @ B
@@ -1,6 +1,12 @@
+import sys
+from array import array
 from ..utilities.utils import bit_count
+from ..utilities.xof import BytesStream
 from .polynomials_generic import GenericPolynomialRing, GenericPolynomial
 
+# Array typecodes for the lane widths used by the SWAR arithmetic
+_SWAR_TYPECODES = {16: "H", 32: "I", 64: "Q"}
+
 
 class PolynomialRing(GenericPolynomialRing):
     """
@@ -21,15 +27,201 @@ class PolynomialRing(GenericPolynomialRing):
         ]
         self.ntt_f = pow(128, -1, 3329)
 
+        # The base case multiplications in the NTT domain are performed
+        # modulo (X^2 - zeta) and (X^2 + zeta) for the last 64 zetas
+        self.ntt_base_zetas = [
+            z for zeta in self.ntt_zetas[64:] for z in (zeta, -zeta)
+        ]
+
+        # Polynomials produced by the ring arithmetic may have coefficients
+        # which are not reduced modulo q. The bound of the coefficients is
+        # tracked, and they are only reduced when the bound would exceed
+        # ``lazy_bound``, which keeps them as small (single digit) integers
+        self.lazy_bound = 1 << 30
+
+        # For SWAR (SIMD within a register) arithmetic all 256 coefficients
+        # are packed into the w-bit lanes of a single integer, so that the big
+        # integer arithmetic of python operates on every lane at once
+        self.swar_ones = {w: self._pack([1] * 256, w) for w in (16, 32, 64)}
+        self.swar_encode_masks = {
+            d: self._swar_encode_masks(d) for d in range(1, 17)
+        }
+
+        # Lookup tables for compression and decompression, which are built
+        # once per ring for every value of d used
+        self._compress_tables = {}
+        self._decompress_tables = {}
+
+        # Lookup tables for sampling from the centered binomial distribution
+        # with eta = 2, where every byte gives two samples
+        self.cbd_tables = {2: self._cbd_tables(2)}
+
+        # For other values of eta, the samples are computed with SWAR in
+        # lanes of 2 * eta bits, with a one in the lowest bit of every lane
+        self.cbd_swar_ones = {
+            eta: ((1 << 512 * eta) - 1) // ((1 << 2 * eta) - 1)
+            for eta in range(1, 9)
+        }
+
+    @staticmethod
+    def _pack(coefficients, w):
+        """
+        Pack 256 non-negative coefficients into a single integer, with the
+        i-th coefficient in the w-bit lane starting from bit w * i
+        """
+        lanes = array(_SWAR_TYPECODES[w], coefficients)
+        if sys.byteorder == "big":
+            lanes.byteswap()
+        return int.from_bytes(lanes.tobytes(), "little")
+
+    @staticmethod
+    def _unpack(t, w):
+        """
+        Unpack the 256 w-bit lanes of an integer into a list of coefficients
+        """
+        lanes = array(_SWAR_TYPECODES[w], t.to_bytes(32 * w, "little"))
+        if sys.byteorder == "big":
+            lanes.byteswap()
+        return lanes.tolist()
+
+    @staticmethod
+    def _swar_encode_masks(d):
+        """
+        Masks used to convert between 256 coefficients packed in 16-bit lanes
+        and 256 consecutive d-bit fields. Each of the eight steps merges
+        pairs of adjacent lanes into a single lane of twice the width, with
+        the field of the odd lane moved down to sit above the even lane.
+
+        Returns a list of tuples (shift, even_mask, odd_mask).
+        """
+        masks = []
+        w, n = 16, 256
+        while n > 1:
+            width = d * w // 16
+            ones = int.from_bytes(
+                (1).to_bytes(w // 4, "little") * (n // 2), "little"
+            )
+            even_mask = ones * ((1 << width) - 1)
+            masks.append((w - width, even_mask, even_mask << width))
+            w, n = 2 * w, n // 2
+        return masks
+
+    def _compress_table(self, d):
+        """
+        Return the table of round((2^d / q) * x) % 2^d for 0 <= x < q
+        """
+        table = self._compress_tables.get(d)
+        if table is None:
+            # 1664 = 3329 // 2
+            table = [((x << d) + 1664) // 3329 % (1 << d) for x in range(3329)]
+            self._compress_tables[d] = table
+        return table
+
+    def _decompress_table(self, d):
+        """
+        Return the table of round((q / 2^d) * x) for 0 <= x < 2^d
+        """
+        table = self._decompress_tables.get(d)
+        if table is None:
+            t = 1 << (d - 1)
+            table = [(3329 * x + t) >> d for x in range(1 << d)]
+            self._decompress_tables[d] = table
+        return table
+
+    def to_ntt_batch(self, elements, out=None):
+        """
+        Convert a list of polynomials into NTT form, optionally writing the
+        results into the elements of the list ``out``
+
+        The pure python ring transforms each polynomial in turn, backends
+        with vectorised arithmetic transform the whole list at once.
+        """
+        if out is None:
+            out = [None] * len(elements)
+        return [f.to_ntt(out=o) for f, o in zip(elements, out)]
+
+    def from_ntt_batch(self, elements, out=None):
+        """
+        Convert a list of polynomials from NTT form, optionally writing the
+        results into the elements of the list ``out``
+
+        The pure python ring transforms each polynomial in turn, backends
+        with vectorised arithmetic transform the whole list at once.
+        """
+        if out is None:
+            out = [None] * len(elements)
+        return [f.from_ntt(out=o) for f, o in zip(elements, out)]
+
+    def cbd_to_ntt_batch(self, inputs, eta):
+        """
+        Sample a polynomial from the centered binomial distribution for each
+        byte string in ``inputs``, see :py:meth:`cbd`, and return them
+        converted into NTT form
+
+        The pure python ring samples and transforms each polynomial in turn,
+        backends with vectorised arithmetic sample the coefficients of all
+        polynomials into one batch which is transformed at once.
+        """
+        return [self.cbd(input_bytes, eta).to_ntt() for input_bytes in inputs]
+
+    @staticmethod
+    def _split_12_bits(input_bytes):
+        """
+        Split bytes into 12-bit integers, two from every three bytes.
+
+        Every three bytes are copied into a 32-bit lane, and then the two
+        12-bit halves of all lanes are moved into 16-bit lanes at once (SWAR).
+        """
+        n = len(input_bytes) // 3
+        lanes = bytearray(4 * n)
+        for i in range(3):
+            lanes[i::4] = input_bytes[i::3]
+
+        mask = int.from_bytes(b"\xff\x0f\x00\x00" * n, "little")
+        t = int.from_bytes(lanes, "little")
+        t = (t & mask) | ((t & (mask << 12)) << 4)
+        values = array("H", t.to_bytes(4 * n, "little"))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+
+    def _sample_candidates(self, input_bytes):
+        """
+        Split bytes into 12-bit candidates, two from every three bytes, and
+        return those which are less than q, in order.
+        """
+        return [c for c in self._split_12_bits(input_bytes) if c < 3329]
+
     @staticmethod
-    def _br(i, k):
+    def _cbd_tables(eta):
         """
-        bit reversal of an unsigned k-bit integer
+        Return the tables of the two samples (a - b) % q from the centered
+        binomial distribution given by the low and high 2 * eta bits of all
+        4 * eta bit integers
         """
-        bin_i = bin(i & (2**k - 1))[2:].zfill(k)
-        return int(bin_i[::-1], 2)
+        mask = (1 << eta) - 1
 
-    def ntt_sample(self, input_bytes):
+        def sample(x):
+            a = bit_count(x & mask)
+            b = bit_count((x >> eta) & mask)
+            return (a - b) % 3329
+
+        size = 1 << (4 * eta)
+        low = [sample(x) for x in range(size)]
+        high = [sample(x >> (2 * eta)) for x in range(size)]
+        return low, high
+
+    @staticmethod
+    def _xof_stream(xof):
+        """
+        Return ``xof`` as a stream, reading bytes with a
+        :py:class:`~kyber_py.utilities.xof.BytesStream`
+        """
+        if isinstance(xof, (bytes, bytearray, memoryview)):
+            return BytesStream(xof)
+        return xof
+
+    def ntt_sample(self, xof):
         """
         Algorithm 1 (Parse)
         https://pq-crystals.org/kyber/data/kyber-specification-round3-20210804.pdf
@@ -37,23 +229,17 @@ class PolynomialRing(GenericPolynomialRing):
         Algorithm 6 (Sample NTT)
 
         Parse: B^* -> R
-        """
-        i, j = 0, 0
-        coefficients = [0 for _ in range(self.n)]
-        while j < self.n:
-            d1 = input_bytes[i] + 256 * (input_bytes[i + 1] % 16)
-            d2 = (input_bytes[i + 1] // 16) + 16 * input_bytes[i + 2]
-
-            if d1 < 3329:
-                coefficients[j] = d1
-                j = j + 1
 
-            if d2 < 3329 and j < self.n:
-                coefficients[j] = d2
-                j = j + 1
-
-            i = i + 3
-        return self(coefficients, is_ntt=True)
+        Three blocks of 168 bytes are read from the stream ``xof``, which
+        give 256 coefficients with probability ~99%, further blocks are read
+        until 256 coefficients have been accepted. The output of the XOF
+        may also be given as bytes, which must hold enough candidates.
+        """
+        xof = self._xof_stream(xof)
+        coefficients = self._sample_candidates(xof.read(3 * 168))
+        while len(coefficients) < self.n:
+            coefficients += self._sample_candidates(xof.read(168))
+        return self._from_trusted(coefficients[: self.n], is_ntt=True)
 
     def cbd(self, input_bytes, eta, is_ntt=False):
         """
@@ -64,19 +250,46 @@ class PolynomialRing(GenericPolynomialRing):
 
         Expects a byte array of length (eta * deg / 4)
         For Kyber, this is 64 eta.
+
+        For eta = 2 every byte of the input gives two coefficients, which are
+        looked up in precomputed tables. Otherwise, all coefficients are
+        computed at once with SWAR arithmetic for 1 <= eta <= 8.
         """
         assert 64 * eta == len(input_bytes)
-        coefficients = [0 for _ in range(256)]
-        b_int = int.from_bytes(input_bytes, "little")
-        mask = (1 << eta) - 1
-        mask2 = (1 << 2 * eta) - 1
-        for i in range(256):
-            x = b_int & mask2
-            a = bit_count(x & mask)
-            b = bit_count((x >> eta) & mask)
-            b_int >>= 2 * eta
-            coefficients[i] = (a - b) % 3329
-        return self(coefficients, is_ntt=is_ntt)
+        if eta in self.cbd_tables:
+            low, high = self.cbd_tables[eta]
+            coefficients = [0] * 256
+            coefficients[0::2] = [low[x] for x in input_bytes]
+            coefficients[1::2] = [high[x] for x in input_bytes]
+            return self._from_trusted(coefficients, is_ntt=is_ntt)
+
+        if eta not in self.cbd_swar_ones:
+            raise ValueError(f"Sampling with {eta = } is not supported")
+
+        # The 2 * eta bit fields of the input are the lanes of one integer.
+        # The eta bits of a and of b in every lane are summed with shifted
+        # adds, and a - b + eta >= 0 is computed in every lane at once
+        ones = self.cbd_swar_ones[eta]
+        t = int.from_bytes(input_bytes, "little")
+        a = t & ones
+        b = (t >> eta) & ones
+        for j in range(1, eta):
+            a += (t >> j) & ones
+            b += (t >> (eta + j)) & ones
+        t = a + ones * eta - b
+
+        # Spread the lanes into 16-bit lanes, and compute (a - b) % q from
+        # a - b + q in [q - eta, q + eta] with a conditional subtraction, as
+        # in `decode()`
+        for shift, even_mask, odd_mask in reversed(
+            self.swar_encode_masks[2 * eta]
+        ):
+            t = (t & even_mask) | ((t & odd_mask) << shift)
+        ones = self.swar_ones[16]
+        t += ones * (3329 - eta)
+        t -= ((t + ones * (0x8000 - 3329)) >> 15 & ones) * 3329
+
+        return self._from_trusted(self._unpack(t, 16), is_ntt=is_ntt)
 
     def decode(self, input_bytes, d, is_ntt=False):
         """
@@ -90,20 +303,46 @@ class PolynomialRing(GenericPolynomialRing):
                 f"input bytes must be a multiple of (polynomial degree) / 8, {256*d = }, {len(input_bytes)*8 = }"
             )
 
-        # Set the modulus
+        # Spread the d-bit fields into 16-bit lanes
+        t = int.from_bytes(input_bytes, "little")
+        for shift, even_mask, odd_mask in reversed(self.swar_encode_masks[d]):
+            t = (t & even_mask) | ((t & odd_mask) << shift)
+
+        # For d = 12 the coefficients are reduced modulo q. For c < 2^12 the
+        # top bit of the lane c + (2^15 - q) is set exactly when c >= q
         if d == 12:
-            m = 3329
-        else:
-            m = 1 << d
+            ones = self.swar_ones[16]
+            t -= ((t + ones * (0x8000 - 3329)) >> 15 & ones) * 3329
+
+        return self._from_trusted(self._unpack(t, 16), is_ntt=is_ntt)
 
-        coeffs = [0 for _ in range(256)]
-        b_int = int.from_bytes(input_bytes, "little")
-        mask = (1 << d) - 1
-        for i in range(256):
-            coeffs[i] = (b_int & mask) % m
-            b_int >>= d
+    def decode_decompress(self, input_bytes, d):
+        """
+        Decode bytes into a polynomial with ``d``-bit coefficients and then
+        decompress it, as used when parsing ciphertexts
+        """
+        return self.decode(input_bytes, d).decompress(d)
 
-        return self(coeffs, is_ntt=is_ntt)
+    def _from_trusted(self, coefficients, is_ntt=False, bound=3329, out=None):
+        """
+        Construct an element of the ring from exactly 256 coefficients which
+        have been produced internally, skipping the type checks and padding
+        performed by ``__call__``.
+
+        When ``out`` is given, the coefficients are written to this element
+        instead, which must be in the same domain.
+        """
+        element = self.element_ntt if is_ntt else self.element
+        if out is None:
+            out = element.__new__(element)
+            out.parent = self
+        elif type(out) is not element:
+            raise TypeError(
+                f"Output must be an element of the same domain, {type(out) = }, {element = }"
+            )
+        out.coeffs = coefficients
+        out.bound = bound
+        return out
 
     def __call__(self, coefficients, is_ntt=False):
         if not is_ntt:
@@ -121,96 +360,237 @@ class PolynomialRing(GenericPolynomialRing):
 
 
 class Polynomial(GenericPolynomial):
-    def __init__(self, parent, coefficients):
+    """
+    An element of the ring R_q. Each polynomial carries a ``bound`` such that
+    every coefficient ``c`` satisfies ``|c| < bound``. Polynomials with
+    ``bound <= q`` are in canonical form, all others are lazily reduced: their
+    coefficients are correct modulo q, and they are reduced before they are
+    encoded, compressed or compared.
+    """
+
+    __slots__ = ("bound",)
+
+    def __init__(self, parent, coefficients, bound=3329):
         self.parent = parent
         self.coeffs = self._parse_coefficients(coefficients)
+        self.bound = bound
 
-    def encode(self, d):
+    def _reduce_lazy(self):
         """
-        Encode (Inverse of Algorithm 3)
+        Reduce the coefficients modulo q if the polynomial is not already
+        in canonical form
         """
-        t = 0
-        for i in range(255):
-            t |= self.coeffs[256 - i - 1]
-            t <<= d
-        t |= self.coeffs[0]
-        return t.to_bytes(32 * d, "little")
+        if self.bound > 3329:
+            self.reduce_coefficients()
+        return self
 
-    def _compress_ele(self, x, d):
+    def reduce_coefficients(self):
         """
-        Compute round((2^d / q) * x) % 2^d
+        Reduce all coefficients modulo q
         """
-        t = 1 << d
-        y = (t * x + 1664) // 3329  # 1664 = 3329 // 2
-        return y % t
+        self.coeffs = [c % 3329 for c in self.coeffs]
+        self.bound = 3329
+        return self
 
-    def _decompress_ele(self, x, d):
+    def compact(self):
         """
-        Compute round((q / 2^d) * x)
+        Store the coefficients in canonical form as an ``array("H")`` of
+        two byte integers rather than a list of python integers, which
+        greatly reduces the memory used by long-lived polynomials, such as
+        those of parsed keys. Compact polynomials support the same
+        arithmetic as any other.
         """
-        t = 1 << (d - 1)
-        y = (3329 * x + t) >> d
-        return y
+        self._reduce_lazy()
+        self.coeffs = array("H", self.coeffs)
+        return self
+
+    def is_zero(self):
+        """
+        Return if polynomial is zero: f = 0
+        """
+        return super(Polynomial, self._reduce_lazy()).is_zero()
+
+    def is_constant(self):
+        """
+        Return if polynomial is constant: f = c
+        """
+        return super(Polynomial, self._reduce_lazy()).is_constant()
+
+    def encode(self, d):
+        """
+        Encode (Inverse of Algorithm 3)
+        """
+        # Pack the coefficients in 16-bit lanes, and then merge the lanes
+        # until the coefficients are in consecutive d-bit fields
+        t = self.parent._pack(self._reduce_lazy().coeffs, 16)
+        for shift, even_mask, odd_mask in self.parent.swar_encode_masks[d]:
+            t = (t & even_mask) | ((t >> shift) & odd_mask)
+        return t.to_bytes(32 * d, "little")
 
     def compress(self, d):
         """
-        Compress the polynomial by compressing each coefficient
+        Compress the polynomial by compressing each coefficient, computing
+        round((2^d / q) * x) % 2^d with a lookup table
 
         NOTE: This is lossy compression
         """
-        self.coeffs = [self._compress_ele(c, d) for c in self.coeffs]
+        table = self.parent._compress_table(d)
+        self.coeffs = [table[c] for c in self._reduce_lazy().coeffs]
         return self
 
     def decompress(self, d):
         """
-        Decompress the polynomial by decompressing each coefficient
+        Decompress the polynomial by decompressing each coefficient, computing
+        round((q / 2^d) * x) with a lookup table. The coefficients must be
+        less than 2^d.
 
         NOTE: This as compression is lossy, we have
         x' = decompress(compress(x)), which x' != x, but is
         close in magnitude.
         """
-        self.coeffs = [self._decompress_ele(c, d) for c in self.coeffs]
+        table = self.parent._decompress_table(d)
+        self.coeffs = [table[c] for c in self._reduce_lazy().coeffs]
         return self
 
-    def to_ntt(self):
+    def compress_encode(self, d):
+        """
+        Compress the polynomial and encode it into bytes, as used when
+        creating ciphertexts. Unlike ``compress(d).encode(d)`` the polynomial
+        itself is left unchanged.
+        """
+        f = self.parent._from_trusted(self.coeffs, bound=self.bound)
+        return f.compress(d).encode(d)
+
+    def to_ntt(self, out=None):
         """
         Convert a polynomial to number-theoretic transform (NTT) form.
         The input is in standard order, the output is in bit-reversed order.
+        When ``out`` is given, the result is written to this polynomial in
+        the NTT domain rather than a new one.
+
+        Only the products ``zeta * c`` are reduced modulo q, so each of the
+        seven layers increases the bound of the coefficients by at most q and
+        the output is lazily reduced.
         """
+        if self.bound + 7 * 3329 > self.parent.lazy_bound:
+            self.reduce_coefficients()
+
         k, l = 1, 128
-        coeffs = self.coeffs
+        coeffs = list(self.coeffs)
         zetas = self.parent.ntt_zetas
         while l >= 2:
-            start = 0
-            while start < 256:
+            for start in range(0, 256, 2 * l):
                 zeta = zetas[k]
                 k = k + 1
-                j = start
                 for j in range(start, start + l):
-                    t = zeta * coeffs[j + l]
+                    t = zeta * coeffs[j + l] % 3329
                     coeffs[j + l] = coeffs[j] - t
                     coeffs[j] = coeffs[j] + t
-                start = l + (j + 1)
             l = l >> 1
 
-        for j in range(256):
-            coeffs[j] = coeffs[j] % 3329
-
-        return self.parent(coeffs, is_ntt=True)
+        return self.parent._from_trusted(
+            coeffs, is_ntt=True, bound=self.bound + 7 * 3329, out=out
+        )
 
-    def from_ntt(self):
+    def from_ntt(self, out=None):
         """
         Not supported, raises a ``TypeError``
         """
         raise TypeError(f"Polynomial not in the NTT domain: {type(self) = }")
 
+    def _add_(self, other):
+        """
+        Add the coefficients of two polynomials without reducing them modulo
+        q, returning the new coefficients and their bound
+        """
+        if isinstance(other, type(self)):
+            if self.bound + other.bound > self.parent.lazy_bound:
+                self.reduce_coefficients()
+                other.reduce_coefficients()
+            new_coeffs = [x + y for x, y in zip(self.coeffs, other.coeffs)]
+            return new_coeffs, self.bound + other.bound
+        elif isinstance(other, int):
+            self._reduce_lazy()
+            new_coeffs = list(self.coeffs)
+            new_coeffs[0] = self._add_mod_q(new_coeffs[0], other)
+            return new_coeffs, self.bound
+        raise NotImplementedError(
+            "Polynomials can only be added to each other"
+        )
+
+    def _sub_(self, other):
+        """
+        Subtract the coefficients of two polynomials without reducing them
+        modulo q, returning the new coefficients and their bound
+        """
+        if isinstance(other, type(self)):
+            if self.bound + other.bound > self.parent.lazy_bound:
+                self.reduce_coefficients()
+                other.reduce_coefficients()
+            new_coeffs = [x - y for x, y in zip(self.coeffs, other.coeffs)]
+            return new_coeffs, self.bound + other.bound
+        elif isinstance(other, int):
+            self._reduce_lazy()
+            new_coeffs = list(self.coeffs)
+            new_coeffs[0] = self._sub_mod_q(new_coeffs[0], other)
+            return new_coeffs, self.bound
+        raise NotImplementedError(
+            "Polynomials can only be subtracted from each other"
+        )
+
+    def add_inplace(self, other):
+        """
+        Add ``other`` to the polynomial in place, returning ``self``.
+
+        Unlike ``f += g``, which binds ``f`` to a new polynomial, this
+        modifies the polynomial itself, and so every other reference to it.
+        """
+        self.coeffs, self.bound = self._add_(other)
+        return self
+
+    def sub_inplace(self, other):
+        """
+        Subtract ``other`` from the polynomial in place, returning ``self``
+        """
+        self.coeffs, self.bound = self._sub_(other)
+        return self
+
+    def __add__(self, other):
+        new_coeffs, bound = self._add_(other)
+        return self.parent._from_trusted(new_coeffs, bound=bound)
+
+    def __sub__(self, other):
+        new_coeffs, bound = self._sub_(other)
+        return self.parent._from_trusted(new_coeffs, bound=bound)
+
+    def __mul__(self, other):
+        if isinstance(other, type(self)):
+            # Multiplication of polynomials is performed in the NTT domain
+            # rather than with the generic methods
+            return (self.to_ntt() * other.to_ntt()).from_ntt()
+        return super().__mul__(other)
+
+    def __eq__(self, other):
+        self._reduce_lazy()
+        if isinstance(other, type(self)):
+            # Coefficients are either stored in a list or a compact array
+            other._reduce_lazy()
+            return list(self.coeffs) == list(other.coeffs)
+        return super().__eq__(other)
+
+    def __getitem__(self, idx):
+        return self._reduce_lazy().coeffs[idx]
+
 
 class PolynomialNTT(Polynomial):
-    def __init__(self, parent, coefficients):
+    __slots__ = ()
+
+    def __init__(self, parent, coefficients, bound=3329):
         self.parent = parent
         self.coeffs = self._parse_coefficients(coefficients)
+        self.bound = bound
 
-    def to_ntt(self):
+    def to_ntt(self, out=None):
         """
         Not supported, raises a ``TypeError``
         """
@@ -218,93 +598,93 @@ class PolynomialNTT(Polynomial):
             f"Polynomial is already in the NTT domain: {type(self) = }"
         )
 
-    def from_ntt(self):
+    def from_ntt(self, out=None):
         """
-        Convert a polynomial from number-theoretic transform (NTT) form in place
+        Convert a polynomial from number-theoretic transform (NTT) form.
         The input is in bit-reversed order, the output is in standard order.
+        When ``out`` is given, the result is written to this polynomial
+        rather than a new one.
+
+        Only the products ``zeta * c`` are reduced modulo q, each layer at
+        most doubles the bound of the sums, which are reduced along with the
+        final scaling by 128^-1.
         """
-        l, l_upper = 2, 128
-        k = l_upper - 1
-        coeffs = self.coeffs
+        if self.bound > self.parent.lazy_bound >> 7:
+            self.reduce_coefficients()
+
+        l, k = 2, 127
+        coeffs = list(self.coeffs)
         zetas = self.parent.ntt_zetas
         while l <= 128:
-            start = 0
-            while start < 256:
+            for start in range(0, 256, 2 * l):
                 zeta = zetas[k]
                 k = k - 1
-                j = start
                 for j in range(start, start + l):
                     t = coeffs[j]
-                    coeffs[j] = t + coeffs[j + l]
-                    coeffs[j + l] = coeffs[j + l] - t
-                    coeffs[j + l] = zeta * coeffs[j + l]
-                start = j + l + 1
+                    u = coeffs[j + l]
+                    coeffs[j] = t + u
+                    coeffs[j + l] = zeta * (u - t) % 3329
             l = l << 1
 
         f = self.parent.ntt_f
-        for j in range(256):
-            coeffs[j] = (coeffs[j] * f) % 3329
-
-        return self.parent(coeffs, is_ntt=False)
+        return self.parent._from_trusted(
+            [c * f % 3329 for c in coeffs], out=out
+        )
 
     @staticmethod
-    def _ntt_base_multiplication(a0, a1, b0, b1, zeta):
-        """
-        Base case for ntt multiplication
-        """
-        r0 = (a0 * b0 + zeta * a1 * b1) % 3329
-        r1 = (a1 * b0 + a0 * b1) % 3329
-        return r0, r1
-
-    def _ntt_coefficient_multiplication(self, f_coeffs, g_coeffs):
-        """
-        Given the coefficients of two polynomials compute the coefficients of
-        their product
-        """
-        new_coeffs = []
-        zetas = self.parent.ntt_zetas
-        for i in range(64):
-            r0, r1 = self._ntt_base_multiplication(
-                f_coeffs[4 * i + 0],
-                f_coeffs[4 * i + 1],
-                g_coeffs[4 * i + 0],
-                g_coeffs[4 * i + 1],
-                zetas[64 + i],
-            )
-            r2, r3 = self._ntt_base_multiplication(
-                f_coeffs[4 * i + 2],
-                f_coeffs[4 * i + 3],
-                g_coeffs[4 * i + 2],
-                g_coeffs[4 * i + 3],
-                -zetas[64 + i],
-            )
-            new_coeffs += [r0, r1, r2, r3]
-        return new_coeffs
+    def multiply_accumulate(fs, gs, out=None):
+        """
+        Compute the sum of the products ``f * g`` for polynomials in NTT form,
+        returning ``sum(f * g for f, g in zip(fs, gs))``. When ``out`` is
+        given, the result is written to this polynomial rather than a new
+        one.
+
+        The 128 base case multiplications of each product are accumulated
+        over all pairs before a single reduction modulo q per coefficient.
+        """
+        parent = fs[0].parent
+        r0 = r1 = r2 = [0] * 128
+        for f, g in zip(fs, gs):
+            a0, a1 = f.coeffs[0::2], f.coeffs[1::2]
+            b0, b1 = g.coeffs[0::2], g.coeffs[1::2]
+            r0 = [r + x * y for r, x, y in zip(r0, a0, b0)]
+            r1 = [
+                r + x * y + u * v for r, x, y, u, v in zip(r1, a1, b0, a0, b1)
+            ]
+            r2 = [r + x * y for r, x, y in zip(r2, a1, b1)]
+
+        # Each base case multiplication is modulo (X^2 - zeta) with zetas
+        # alternating in sign
+        zetas = parent.ntt_base_zetas
+        new_coeffs = [0] * 256
+        new_coeffs[0::2] = [
+            (x + z * y) % 3329 for x, y, z in zip(r0, r2, zetas)
+        ]
+        new_coeffs[1::2] = [x % 3329 for x in r1]
+        return parent._from_trusted(new_coeffs, is_ntt=True, out=out)
 
-    def _ntt_multiplication(self, other):
+    def mul_acc_inplace(self, fs, gs):
         """
-        Number Theoretic Transform multiplication.
+        Add the sum of the products ``f * g`` for pairs of polynomials in
+        ``fs`` and ``gs`` to the polynomial in place, returning ``self``
         """
-        new_coeffs = self._ntt_coefficient_multiplication(
-            self.coeffs, other.coeffs
-        )
-        return new_coeffs
+        return self.add_inplace(self.multiply_accumulate(fs, gs))
 
     def __add__(self, other):
-        new_coeffs = self._add_(other)
-        return self.parent(new_coeffs, is_ntt=True)
+        new_coeffs, bound = self._add_(other)
+        return self.parent._from_trusted(new_coeffs, is_ntt=True, bound=bound)
 
     def __sub__(self, other):
-        new_coeffs = self._sub_(other)
-        return self.parent(new_coeffs, is_ntt=True)
+        new_coeffs, bound = self._sub_(other)
+        return self.parent._from_trusted(new_coeffs, is_ntt=True, bound=bound)
 
     def __mul__(self, other):
         if isinstance(other, type(self)):
-            new_coeffs = self._ntt_multiplication(other)
+            return self.multiply_accumulate([self], [other])
         elif isinstance(other, int):
             new_coeffs = [(c * other) % 3329 for c in self.coeffs]
         else:
             raise NotImplementedError(
                 f"Polynomials can only be multiplied by each other, or scaled by integers, {type(other) = }, {type(self) = }"
             )
-        return self.parent(new_coeffs, is_ntt=True)
+        return self.parent._from_trusted(new_coeffs, is_ntt=True)
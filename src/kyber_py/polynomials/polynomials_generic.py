@@ -1,17 +1,88 @@
 import random
 
 
+def _is_prime(q):
+    """
+    Miller-Rabin primality test, which is deterministic for q < 3.3 * 10^24
+    """
+    if q < 2:
+        return False
+    bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    for p in bases:
+        if q % p == 0:
+            return q == p
+    d, s = q - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for a in bases:
+        x = pow(a, d, q)
+        if x in (1, q - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % q
+            if x == q - 1:
+                break
+        else:
+            return False
+    return True
+
+
 class GenericPolynomialRing:
     """
     Initialise the polynomial ring:
 
         R = GF(q) / (X^n + 1)
+
+    When q is prime and n is a power of two, polynomials are multiplied
+    using a (possibly incomplete) negacyclic NTT, otherwise Karatsuba
+    multiplication is used.
     """
 
     def __init__(self, q, n):
         self.q = q
         self.n = n
         self.element = GenericPolynomial
+        self._init_ntt()
+
+    @staticmethod
+    def _br(i, k):
+        """
+        bit reversal of an unsigned k-bit integer
+        """
+        bin_i = bin(i & (2**k - 1))[2:].zfill(k)
+        return int(bin_i[::-1], 2)
+
+    def _init_ntt(self):
+        """
+        Find the largest number of layers l such that X^n + 1 splits into the
+        2^l factors X^(n / 2^l) - gamma modulo q, which requires a primitive
+        2^(l+1)-th root of unity zeta modulo q, and precompute the powers of
+        zeta used by the NTT. When l = 0 the NTT is not used.
+        """
+        q, n = self.q, self.n
+        self.ntt_layers = 0
+        if n < 2 or n & (n - 1) or not _is_prime(q):
+            return
+
+        l = 0
+        while (1 << l) < n and (q - 1) % (1 << (l + 2)) == 0:
+            l += 1
+        if l == 0:
+            return
+
+        # Find an element of order exactly 2^(l+1)
+        for g in range(2, q):
+            zeta = pow(g, (q - 1) >> (l + 1), q)
+            if pow(zeta, 1 << l, q) == q - 1:
+                break
+
+        self.ntt_layers = l
+        self.ntt_roots = [pow(zeta, self._br(i, l), q) for i in range(1 << l)]
+        self.ntt_roots_inv = [pow(z, -1, q) for z in self.ntt_roots]
+        self.ntt_base_roots = [
+            pow(zeta, 2 * self._br(i, l) + 1, q) for i in range(1 << l)
+        ]
+        self.ntt_scale = pow(1 << l, -1, q)
 
     def zero(self):
         """
@@ -47,6 +118,8 @@ class GenericPolynomialRing:
 
 
 class GenericPolynomial:
+    __slots__ = ("parent", "coeffs")
+
     def __init__(self, parent, coefficients):
         self.parent = parent
         self.coeffs = self._parse_coefficients(coefficients)
@@ -114,6 +187,114 @@ class GenericPolynomial:
                 new_coeffs[i + j - n] -= a[i] * b[j]
         return [c % self.parent.q for c in new_coeffs]
 
+    @staticmethod
+    def _karatsuba(a, b):
+        """
+        Compute the (non-reduced) product of two polynomials of the same
+        length given as lists of coefficients, using Karatsuba multiplication
+        for long inputs
+        """
+        n = len(a)
+        if n <= 16:
+            c = [0] * (2 * n - 1)
+            for i, x in enumerate(a):
+                for j, y in enumerate(b):
+                    c[i + j] += x * y
+            return c
+
+        # Split the inputs into halves of length h, padding the top halves
+        h = (n + 1) // 2
+        pad = [0] * (2 * h - n)
+        a0, a1 = a[:h], a[h:] + pad
+        b0, b1 = b[:h], b[h:] + pad
+
+        karatsuba = GenericPolynomial._karatsuba
+        z0 = karatsuba(a0, b0)
+        z2 = karatsuba(a1, b1)
+        z1 = karatsuba(
+            [x + y for x, y in zip(a0, a1)], [x + y for x, y in zip(b0, b1)]
+        )
+
+        c = [0] * (4 * h - 1)
+        for i in range(2 * h - 1):
+            c[i] += z0[i]
+            c[i + h] += z1[i] - z0[i] - z2[i]
+            c[i + 2 * h] += z2[i]
+        return c[: 2 * n - 1]
+
+    def _karatsuba_multiplication(self, other):
+        """
+        Multiplication of polynomials with Karatsuba multiplication followed
+        by reduction modulo X^n + 1, suitable for all R_q = F_q[X]/(X^n + 1)
+        """
+        n = self.parent.n
+        c = self._karatsuba(self.coeffs, other.coeffs)
+        c.append(0)
+        return [(x - y) % self.parent.q for x, y in zip(c[:n], c[n:])]
+
+    def _ntt(self):
+        """
+        Compute the (incomplete) negacyclic NTT of the polynomial, returning
+        the coefficients of its reductions modulo each X^m - gamma in
+        bit-reversed order
+        """
+        n, q = self.parent.n, self.parent.q
+        m = n >> self.parent.ntt_layers
+        roots = self.parent.ntt_roots
+        coeffs = [c % q for c in self.coeffs]
+        k, length = 1, n // 2
+        while length >= m:
+            for start in range(0, n, 2 * length):
+                zeta = roots[k]
+                k = k + 1
+                for j in range(start, start + length):
+                    t = zeta * coeffs[j + length] % q
+                    coeffs[j + length] = coeffs[j] - t
+                    coeffs[j] = coeffs[j] + t
+            length = length >> 1
+        return coeffs
+
+    def _intt(self, coeffs):
+        """
+        Invert ``_ntt``, returning the coefficients of the polynomial reduced
+        modulo q
+        """
+        n, q = self.parent.n, self.parent.q
+        m = n >> self.parent.ntt_layers
+        roots_inv = self.parent.ntt_roots_inv
+        length = m
+        while length < n:
+            for start in range(0, n, 2 * length):
+                zeta_inv = roots_inv[(n + start) // (2 * length)]
+                for j in range(start, start + length):
+                    t = coeffs[j]
+                    u = coeffs[j + length]
+                    coeffs[j] = (t + u) % q
+                    coeffs[j + length] = zeta_inv * (t - u) % q
+            length = length << 1
+        f = self.parent.ntt_scale
+        return [c * f % q for c in coeffs]
+
+    def _ntt_multiplication(self, other):
+        """
+        Multiplication of polynomials in the NTT domain, where the base case
+        products modulo X^m - gamma are computed with schoolbook
+        multiplication
+        """
+        n, q = self.parent.n, self.parent.q
+        m = n >> self.parent.ntt_layers
+        a, b = self._ntt(), other._ntt()
+        c = [0] * n
+        for i, gamma in enumerate(self.parent.ntt_base_roots):
+            s = i * m
+            if m == 1:
+                c[s] = a[s] * b[s] % q
+                continue
+            base = self._karatsuba(a[s : s + m], b[s : s + m]) + [0]
+            for j in range(m):
+                c[s + j] = (base[j] + gamma * base[j + m]) % q
+        return self._intt(c)
+
     def __neg__(self):
         """
         Returns -f, by negating all coefficients
@@ -173,9 +354,38 @@ class GenericPolynomial:
         self = self - other
         return self
 
+    def add_inplace(self, other):
+        """
+        Add ``other`` to the polynomial in place, returning ``self``.
+
+        Unlike ``f += g``, which binds ``f`` to a new polynomial, this
+        modifies the polynomial itself, and so every other reference to it.
+        """
+        self.coeffs = self._add_(other)
+        return self
+
+    def sub_inplace(self, other):
+        """
+        Subtract ``other`` from the polynomial in place, returning ``self``
+        """
+        self.coeffs = self._sub_(other)
+        return self
+
+    def mul_acc_inplace(self, fs, gs):
+        """
+        Add the sum of the products ``f * g`` for pairs of polynomials in
+        ``fs`` and ``gs`` to the polynomial in place, returning ``self``
+        """
+        for f, g in zip(fs, gs):
+            self.add_inplace(f * g)
+        return self
+
     def __mul__(self, other):
         if isinstance(other, type(self)):
-            new_coeffs = self._schoolbook_multiplication(other)
+            if self.parent.ntt_layers:
+                new_coeffs = self._ntt_multiplication(other)
+            else:
+                new_coeffs = self._karatsuba_multiplication(other)
         elif isinstance(other, int):
             new_coeffs = [(c * other) % self.parent.q for c in self.coeffs]
         else:
@@ -0,0 +1,501 @@
+"""
+NumPy backed implementation of the polynomial ring used by ML-KEM and Kyber.
+
+The classes in this file are drop-in replacements for
+:py:class:`~kyber_py.polynomials.polynomials.PolynomialRing` and its
+elements, but store the 256 coefficients of each polynomial as an ``int64``
+array and perform the NTT, inverse NTT and NTT multiplication as vectorised
+operations, with one array operation per butterfly layer.
+
+NumPy is an optional dependency, when it is not installed ``HAVE_NUMPY`` is
+``False`` and constructing :py:class:`PolynomialRingNumpy` raises an
+``ImportError``.
+"""
+
+try:
+    import numpy as np
+
+    HAVE_NUMPY = True
+except ImportError:  # pragma: no cover
+    HAVE_NUMPY = False
+
+from .polynomials import PolynomialRing, Polynomial
+
+
+class PolynomialRingNumpy(PolynomialRing):
+    """
+    Initialise the polynomial ring:
+
+        R = GF(3329) / (X^256 + 1)
+
+    with coefficients stored in NumPy arrays.
+    """
+
+    def __init__(self):
+        if not HAVE_NUMPY:
+            raise ImportError("The NumPy backend requires numpy")
+        super().__init__()
+        self.element = PolynomialNumpy
+        self.element_ntt = PolynomialNTTNumpy
+
+        # For the NTT, layer i uses 2^i zetas, one per block of butterflies,
+        # we precompute these as column vectors so they can be broadcast
+        # across each block
+        zetas = np.array(self.ntt_zetas, dtype=np.int64)
+        self.ntt_layer_zetas = [
+            zetas[1 << i : 2 << i].reshape(-1, 1) for i in range(7)
+        ]
+        # The inverse NTT walks the same zetas in reverse order
+        self.intt_layer_zetas = [z[::-1] for z in self.ntt_layer_zetas[::-1]]
+        self.ntt_base_zetas = np.array(self.ntt_base_zetas, dtype=np.int64)
+
+        # The centered binomial distribution tables, as arrays which can be
+        # indexed by a whole batch of inputs
+        self.cbd_table_arrays = {
+            eta: tuple(
+                np.array(t, dtype=np.int64) for t in self._cbd_tables(eta)
+            )
+            for eta in (2, 3)
+        }
+
+        # Coefficients are stored as int64, so we only need to reduce when
+        # the bound of the coefficients approaches 2^63
+        self.lazy_bound = 1 << 62
+
+    def _ntt(self, coeffs, bound=3329):
+        """
+        Compute the NTT in place of every row of a ``(m, 256)`` array of
+        coefficients. Each of the seven layers of butterflies is computed as
+        a single vectorised operation across all ``m`` polynomials.
+
+        Each layer multiplies the bound of the coefficients by (q + 1) and
+        the coefficients are only reduced when the next layer could overflow.
+        """
+        l = 128
+        for zetas in self.ntt_layer_zetas:
+            if bound * 3330 > self.lazy_bound:
+                coeffs %= 3329
+                bound = 3329
+            a = coeffs.reshape(len(coeffs), -1, 2, l)
+            t = zetas * a[:, :, 1]
+            a[:, :, 1] = a[:, :, 0] - t
+            a[:, :, 0] += t
+            bound *= 3330
+            l >>= 1
+        coeffs %= 3329
+        return coeffs
+
+    def _intt(self, coeffs, bound=3329):
+        """
+        Compute the inverse NTT in place of every row of a ``(m, 256)`` array
+        of coefficients, one vectorised operation per layer.
+
+        Each layer multiplies the bound of the coefficients by 2q and the
+        coefficients are only reduced when the next layer could overflow.
+        """
+        l = 2
+        for zetas in self.intt_layer_zetas:
+            if bound * 2 * 3329 > self.lazy_bound:
+                coeffs %= 3329
+                bound = 3329
+            a = coeffs.reshape(len(coeffs), -1, 2, l)
+            t = a[:, :, 0].copy()
+            a[:, :, 0] += a[:, :, 1]
+            a[:, :, 1] -= t
+            a[:, :, 1] *= zetas
+            bound *= 2 * 3329
+            l <<= 1
+        if bound * 3329 > self.lazy_bound:
+            coeffs %= 3329
+        coeffs *= self.ntt_f
+        coeffs %= 3329
+        return coeffs
+
+    def to_ntt_batch(self, elements, out=None):
+        """
+        Convert a list of polynomials into NTT form, transforming all of them
+        as a single ``(len(elements), 256)`` batch, optionally writing the
+        results into the elements of the list ``out``
+        """
+        if any(isinstance(f, self.element_ntt) for f in elements):
+            raise TypeError("Polynomial is already in the NTT domain")
+        bound = max(f.bound for f in elements)
+        coeffs = self._ntt(np.stack([f.coeffs for f in elements]), bound)
+        if out is None:
+            out = [None] * len(elements)
+        return [
+            self._from_trusted(c, is_ntt=True, out=o)
+            for c, o in zip(coeffs, out)
+        ]
+
+    def from_ntt_batch(self, elements, out=None):
+        """
+        Convert a list of polynomials from NTT form, transforming all of them
+        as a single ``(len(elements), 256)`` batch, optionally writing the
+        results into the elements of the list ``out``
+        """
+        if not all(isinstance(f, self.element_ntt) for f in elements):
+            raise TypeError("Polynomial not in the NTT domain")
+        bound = max(f.bound for f in elements)
+        coeffs = self._intt(np.stack([f.coeffs for f in elements]), bound)
+        if out is None:
+            out = [None] * len(elements)
+        return [self._from_trusted(c, out=o) for c, o in zip(coeffs, out)]
+
+    def cbd_to_ntt_batch(self, inputs, eta):
+        """
+        Sample a polynomial from the centered binomial distribution for each
+        byte string in ``inputs``, and return them converted into NTT form.
+
+        The coefficients of all polynomials are looked up into a single
+        ``(len(inputs), 256)`` array, which is transformed as one batch.
+        """
+        if eta not in self.cbd_table_arrays:
+            return super().cbd_to_ntt_batch(inputs, eta)
+        low, high = self.cbd_table_arrays[eta]
+        b = np.frombuffer(b"".join(inputs), dtype=np.uint8)
+        if eta == 2:
+            values = b.reshape(len(inputs), 128)
+        else:
+            b = b.astype(np.int64).reshape(len(inputs), 64, 3)
+            values = np.empty((len(inputs), 64, 2), dtype=np.int64)
+            values[..., 0] = b[..., 0] | (b[..., 1] & 15) << 8
+            values[..., 1] = b[..., 1] >> 4 | b[..., 2] << 4
+            values = values.reshape(len(inputs), 128)
+        coeffs = np.empty((len(inputs), 256), dtype=np.int64)
+        coeffs[:, 0::2] = low[values]
+        coeffs[:, 1::2] = high[values]
+        coeffs = self._ntt(coeffs)
+        return [self._from_trusted(c, is_ntt=True) for c in coeffs]
+
+    def ntt_sample(self, xof):
+        """
+        Algorithm 6 (Sample NTT)
+
+        All candidates of three blocks of 168 bytes read from the stream
+        ``xof`` are computed and filtered at once, further blocks are read
+        until 256 coefficients have been accepted. The output of the XOF
+        may also be given as bytes.
+        """
+        xof = self._xof_stream(xof)
+        coefficients = self._sample_candidates(xof.read(3 * 168))
+        while len(coefficients) < self.n:
+            coefficients = np.concatenate(
+                (coefficients, self._sample_candidates(xof.read(168)))
+            )
+        return self._from_trusted(coefficients[: self.n], is_ntt=True)
+
+    @staticmethod
+    def _sample_candidates(input_bytes):
+        """
+        Split bytes into 12-bit candidates, two from every three bytes, and
+        return those which are less than q, in order.
+        """
+        b = np.frombuffer(input_bytes, dtype=np.uint8).astype(np.int64)
+        b = b.reshape(-1, 3)
+        candidates = np.empty((len(b), 2), dtype=np.int64)
+        candidates[:, 0] = b[:, 0] | (b[:, 1] & 15) << 8
+        candidates[:, 1] = b[:, 1] >> 4 | b[:, 2] << 4
+        candidates = candidates.reshape(-1)
+        return candidates[candidates < 3329]
+
+    def decode(self, input_bytes, d, is_ntt=False):
+        """
+        Decode (Algorithm 3)
+
+        decode: B^32l -> R_q
+        """
+        if 256 * d != len(input_bytes) * 8:
+            raise ValueError(
+                f"input bytes must be a multiple of (polynomial degree) / 8, {256*d = }, {len(input_bytes)*8 = }"
+            )
+
+        bits = np.unpackbits(
+            np.frombuffer(input_bytes, dtype=np.uint8), bitorder="little"
+        )
+        weights = np.left_shift(1, np.arange(d, dtype=np.int64))
+        coeffs = bits.reshape(256, d).astype(np.int64) @ weights
+
+        # Set the modulus
+        if d == 12:
+            coeffs %= 3329
+
+        return self._from_trusted(coeffs, is_ntt=is_ntt)
+
+    def _from_trusted(self, coefficients, is_ntt=False, bound=3329, out=None):
+        """
+        Construct an element of the ring from exactly 256 coefficients which
+        have been produced internally, skipping the type checks and padding
+        performed by ``__call__``. Lists of coefficients are converted to
+        arrays.
+        """
+        if not isinstance(coefficients, np.ndarray):
+            coefficients = np.array(coefficients, dtype=np.int64)
+        return super()._from_trusted(coefficients, is_ntt, bound, out)
+
+    def __call__(self, coefficients, is_ntt=False):
+        if isinstance(coefficients, np.ndarray):
+            if not is_ntt:
+                return self.element(self, coefficients)
+            return self.element_ntt(self, coefficients)
+        return super().__call__(coefficients, is_ntt=is_ntt)
+
+
+class PolynomialNumpy(Polynomial):
+    __slots__ = ()
+
+    def __init__(self, parent, coefficients, bound=3329):
+        self.parent = parent
+        self.coeffs = self._parse_coefficients(coefficients)
+        self.bound = bound
+
+    def _parse_coefficients(self, coefficients):
+        """
+        Helper function which right pads with zeros and stores the
+        coefficients as an ``int64`` array
+        """
+        l = len(coefficients)
+        if l > self.parent.n:
+            raise ValueError(
+                f"Coefficients describe polynomial of degree greater than maximum degree {self.parent.n}"
+            )
+        if l == self.parent.n and isinstance(coefficients, np.ndarray):
+            return coefficients.astype(np.int64, copy=False)
+        coeffs = np.zeros(self.parent.n, dtype=np.int64)
+        coeffs[:l] = coefficients
+        return coeffs
+
+    def compact(self):
+        """
+        Reduce the coefficients to canonical form and store them in an array
+        owned by the polynomial, rather than a view which keeps a larger
+        array alive. The coefficients are left as ``int64`` to avoid
+        overflows in the lazily reduced arithmetic.
+        """
+        self._reduce_lazy()
+        self.coeffs = self.coeffs.copy()
+        return self
+
+    def is_zero(self):
+        """
+        Return if polynomial is zero: f = 0
+        """
+        return not self._reduce_lazy().coeffs.any()
+
+    def is_constant(self):
+        """
+        Return if polynomial is constant: f = c
+        """
+        return not self._reduce_lazy().coeffs[1:].any()
+
+    def reduce_coefficients(self):
+        """
+        Reduce all coefficients modulo q
+        """
+        self.coeffs = self.coeffs % 3329
+        self.bound = 3329
+        return self
+
+    def encode(self, d):
+        """
+        Encode (Inverse of Algorithm 3)
+        """
+        shifts = np.arange(d, dtype=np.int64)
+        bits = (self._reduce_lazy().coeffs.reshape(256, 1) >> shifts) & 1
+        return np.packbits(
+            bits.astype(np.uint8).reshape(-1), bitorder="little"
+        ).tobytes()
+
+    def compress(self, d):
+        """
+        Compress the polynomial by compressing each coefficient
+
+        NOTE: This is lossy compression
+        """
+        t = 1 << d
+        self._reduce_lazy()
+        self.coeffs = ((t * self.coeffs + 1664) // 3329) % t
+        return self
+
+    def decompress(self, d):
+        """
+        Decompress the polynomial by decompressing each coefficient
+
+        NOTE: This as compression is lossy, we have
+        x' = decompress(compress(x)), which x' != x, but is
+        close in magnitude.
+        """
+        t = 1 << (d - 1)
+        self._reduce_lazy()
+        self.coeffs = (3329 * self.coeffs + t) >> d
+        return self
+
+    def to_ntt(self, out=None):
+        """
+        Convert a polynomial to number-theoretic transform (NTT) form.
+        The input is in standard order, the output is in bit-reversed order.
+        When ``out`` is given, the result is written to this polynomial in
+        the NTT domain rather than a new one.
+        """
+        coeffs = self.parent._ntt(
+            self.coeffs.reshape(1, 256).copy(), self.bound
+        )
+        return self.parent._from_trusted(coeffs[0], is_ntt=True, out=out)
+
+    def _add_(self, other):
+        """
+        Add the coefficients of two polynomials without reducing them modulo
+        q, returning the new coefficients and their bound
+        """
+        if isinstance(other, type(self)):
+            if self.bound + other.bound > self.parent.lazy_bound:
+                self.reduce_coefficients()
+                other.reduce_coefficients()
+            return self.coeffs + other.coeffs, self.bound + other.bound
+        elif isinstance(other, int):
+            self._reduce_lazy()
+            new_coeffs = self.coeffs.copy()
+            new_coeffs[0] = (new_coeffs[0] + other) % 3329
+            return new_coeffs, self.bound
+        raise NotImplementedError(
+            "Polynomials can only be added to each other"
+        )
+
+    def _sub_(self, other):
+        """
+        Subtract the coefficients of two polynomials without reducing them
+        modulo q, returning the new coefficients and their bound
+        """
+        if isinstance(other, type(self)):
+            if self.bound + other.bound > self.parent.lazy_bound:
+                self.reduce_coefficients()
+                other.reduce_coefficients()
+            return self.coeffs - other.coeffs, self.bound + other.bound
+        elif isinstance(other, int):
+            self._reduce_lazy()
+            new_coeffs = self.coeffs.copy()
+            new_coeffs[0] = (new_coeffs[0] - other) % 3329
+            return new_coeffs, self.bound
+        raise NotImplementedError(
+            "Polynomials can only be subtracted from each other"
+        )
+
+    def __neg__(self):
+        """
+        Returns -f, by negating all coefficients
+        """
+        return self.parent._from_trusted(-self.coeffs % 3329)
+
+    def __mul__(self, other):
+        if isinstance(other, type(self)):
+            # Multiplication of polynomials is performed in the NTT domain
+            # rather than with the schoolbook method
+            return (self.to_ntt() * other.to_ntt()).from_ntt()
+        elif isinstance(other, int):
+            new_coeffs = (self._reduce_lazy().coeffs * (other % 3329)) % 3329
+        else:
+            raise NotImplementedError(
+                "Polynomials can only be multiplied by each other, or scaled by integers"
+            )
+        return self.parent(new_coeffs)
+
+    def __eq__(self, other):
+        self._reduce_lazy()
+        if isinstance(other, type(self)):
+            other._reduce_lazy()
+            return bool(np.array_equal(self.coeffs, other.coeffs))
+        elif isinstance(other, int):
+            if self.is_constant() and (other % 3329) == self.coeffs[0]:
+                return True
+        return False
+
+    def __getitem__(self, idx):
+        return int(self._reduce_lazy().coeffs[idx])
+
+
+class PolynomialNTTNumpy(PolynomialNumpy):
+    __slots__ = ()
+
+    def __init__(self, parent, coefficients, bound=3329):
+        self.parent = parent
+        self.coeffs = self._parse_coefficients(coefficients)
+        self.bound = bound
+
+    def to_ntt(self, out=None):
+        """
+        Not supported, raises a ``TypeError``
+        """
+        raise TypeError(
+            f"Polynomial is already in the NTT domain: {type(self) = }"
+        )
+
+    def from_ntt(self, out=None):
+        """
+        Convert a polynomial from number-theoretic transform (NTT) form.
+        The input is in bit-reversed order, the output is in standard order.
+        When ``out`` is given, the result is written to this polynomial
+        rather than a new one.
+        """
+        coeffs = self.parent._intt(
+            self.coeffs.reshape(1, 256).copy(), self.bound
+        )
+        return self.parent._from_trusted(coeffs[0], out=out)
+
+    @staticmethod
+    def multiply_accumulate(fs, gs, out=None):
+        """
+        Compute the sum of the products ``f * g`` for polynomials in NTT form,
+        returning ``sum(f * g for f, g in zip(fs, gs))``. When ``out`` is
+        given, the result is written to this polynomial rather than a new
+        one.
+
+        All base case multiplications of every pair are computed at once and
+        summed before a single reduction modulo q.
+        """
+        parent = fs[0].parent
+        bound = max(f.bound for f in fs) * max(g.bound for g in gs)
+        if len(fs) * bound * 3330 > parent.lazy_bound:
+            for f in [*fs, *gs]:
+                f._reduce_lazy()
+
+        f = np.stack([f.coeffs for f in fs]).reshape(-1, 128, 2)
+        g = np.stack([g.coeffs for g in gs]).reshape(-1, 128, 2)
+
+        new_coeffs = np.empty((128, 2), dtype=np.int64)
+        new_coeffs[:, 0] = (f[:, :, 0] * g[:, :, 0]).sum(axis=0)
+        new_coeffs[:, 0] += parent.ntt_base_zetas * (
+            f[:, :, 1] * g[:, :, 1]
+        ).sum(axis=0)
+        new_coeffs[:, 1] = (
+            f[:, :, 1] * g[:, :, 0] + f[:, :, 0] * g[:, :, 1]
+        ).sum(axis=0)
+        new_coeffs %= 3329
+        return parent._from_trusted(
+            new_coeffs.reshape(256), is_ntt=True, out=out
+        )
+
+    def mul_acc_inplace(self, fs, gs):
+        """
+        Add the sum of the products ``f * g`` for pairs of polynomials in
+        ``fs`` and ``gs`` to the polynomial in place, returning ``self``
+        """
+        return self.add_inplace(self.multiply_accumulate(fs, gs))
+
+    def __add__(self, other):
+        new_coeffs, bound = self._add_(other)
+        return self.parent._from_trusted(new_coeffs, is_ntt=True, bound=bound)
+
+    def __sub__(self, other):
+        new_coeffs, bound = self._sub_(other)
+        return self.parent._from_trusted(new_coeffs, is_ntt=True, bound=bound)
+
+    def __mul__(self, other):
+        if isinstance(other, type(self)):
+            return self.multiply_accumulate([self], [other])
+        elif isinstance(other, int):
+            new_coeffs = (self._reduce_lazy().coeffs * (other % 3329)) % 3329
+        else:
+            raise NotImplementedError(
+                f"Polynomials can only be multiplied by each other, or scaled by integers, {type(other) = }, {type(self) = }"
+            )
+        return self.parent(new_coeffs, is_ntt=True)
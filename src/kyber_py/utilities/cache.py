@@ -0,0 +1,183 @@
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+CacheInfo = namedtuple(
+    "CacheInfo",
+    [
+        "hits",
+        "misses",
+        "evictions",
+        "currsize",
+        "nbytes",
+        "maxsize",
+        "maxbytes",
+    ],
+)
+
+
+class LRUCache:
+    """
+    A least recently used cache, bounded both by the number of entries it
+    holds (``maxsize``) and by the total size in bytes of its values
+    (``maxbytes``, unbounded when None).
+
+    The size of each value is given by the caller when it is stored, and
+    entries are evicted from the least recently used until both bounds
+    hold. A value larger than ``maxbytes`` on its own is not stored.
+    """
+
+    def __init__(self, maxsize=128, maxbytes=None):
+        if maxsize < 1:
+            raise ValueError("The cache must hold at least one entry")
+        if maxbytes is not None and maxbytes < 1:
+            raise ValueError("The memory cap of the cache must be positive")
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key):
+        """
+        Return the value stored for ``key`` and mark it as the most recently
+        used, or None when it is not in the cache
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, nbytes=0):
+        """
+        Store ``value`` for ``key``, which takes up ``nbytes`` bytes,
+        evicting the least recently used entries to make room for it
+        """
+        if self.maxbytes is not None and nbytes > self.maxbytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            self._data[key] = (value, nbytes)
+            self.nbytes += nbytes
+            while len(self._data) > self.maxsize or (
+                self.maxbytes is not None and self.nbytes > self.maxbytes
+            ):
+                _, (_, size) = self._data.popitem(last=False)
+                self.nbytes -= size
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Remove every entry from the cache and reset its statistics
+        """
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self):
+        """
+        Return the statistics of the cache as a :py:class:`CacheInfo`
+        """
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.evictions,
+            len(self._data),
+            self.nbytes,
+            self.maxsize,
+            self.maxbytes,
+        )
+
+
+class MatrixCacheMixin:
+    """
+    The cache of the matrices expanded from the seeds ``rho`` of
+    encapsulation keys, shared by the schemes which provide the method
+    ``_generate_matrix_from_seed(rho, transpose)``.
+
+    The cache is disabled by default, see :py:meth:`enable_matrix_cache`.
+    """
+
+    matrix_cache = None
+
+    def enable_matrix_cache(self, maxsize=128, maxbytes=None):
+        """
+        Cache the matrices expanded from the seeds ``rho`` of encapsulation
+        keys, so that encapsulating to, or decapsulating with, the same keys
+        again skips the expansion of the matrix.
+
+        The cache keeps the ``maxsize`` most recently used matrices, and
+        when ``maxbytes`` is set, at most that many bytes of coefficients.
+        Matrices are only cached when encrypting, as the seeds of freshly
+        generated keys are unlikely to be seen again.
+
+        NOTE:
+          The cache only holds public data, but reveals which keys have
+          been used recently. Use :py:meth:`clear_matrix_cache` or
+          :py:meth:`disable_matrix_cache` to drop it.
+
+        :param int maxsize: the maximum number of cached matrices
+        :param int maxbytes: the maximum memory of the cached matrices
+        """
+        self.matrix_cache = LRUCache(maxsize, maxbytes)
+
+    def disable_matrix_cache(self):
+        """
+        Clear and disable the cache of expanded matrices
+        """
+        if self.matrix_cache is not None:
+            self.matrix_cache.clear()
+        self.matrix_cache = None
+
+    def clear_matrix_cache(self):
+        """
+        Remove every matrix from the cache of expanded matrices, and reset
+        its statistics
+        """
+        if self.matrix_cache is not None:
+            self.matrix_cache.clear()
+
+    def matrix_cache_info(self):
+        """
+        Return the statistics of the cache of expanded matrices, or None
+        when it is disabled
+
+        :rtype: CacheInfo
+        """
+        if self.matrix_cache is None:
+            return None
+        return self.matrix_cache.info()
+
+    def _cached_matrix_from_seed(self, rho, transpose=False):
+        """
+        Helper function which returns the matrix generated from the seed
+        `rho`, from the cache of expanded matrices when it is enabled.
+
+        The cached matrices are compact, and must not be modified.
+        """
+        cache = self.matrix_cache
+        if cache is None:
+            return self._generate_matrix_from_seed(rho, transpose)
+        key = (rho, transpose)
+        A_hat = cache.get(key)
+        if A_hat is None:
+            A_hat = self._generate_matrix_from_seed(rho, transpose).compact()
+            cache.put(key, A_hat, A_hat.nbytes())
+        return A_hat
@@ -0,0 +1,67 @@
+from hashlib import shake_128
+
+
+class Shake128Stream:
+    """
+    Read the output of SHAKE128 incrementally, as needed by the XOF of
+    ML-KEM when sampling polynomials by rejection.
+
+    The ``shake_128`` of hashlib can only produce a digest of a given length
+    from the start of the output, so the output is squeezed in blocks of the
+    SHAKE128 rate (168 bytes), starting with ``blocks`` blocks. Reading past
+    these squeezes the digest again with as many blocks as are needed, which
+    only happens for the rare long tails of rejection sampling.
+
+    When ``state`` is given, it is a ``shake_128`` object which has already
+    absorbed a prefix of the input (such as a seed shared by many calls), and
+    is copied before absorbing ``input_bytes``.
+    """
+
+    RATE = 168
+
+    def __init__(self, input_bytes, blocks=3, state=None):
+        if state is None:
+            self._shake = shake_128(input_bytes)
+        else:
+            self._shake = state.copy()
+            self._shake.update(input_bytes)
+        self._output = self._shake.digest(blocks * self.RATE)
+        self._index = 0
+
+    def read(self, n):
+        """
+        Return the next ``n`` bytes of output
+        """
+        end = self._index + n
+        if end > len(self._output):
+            blocks = -(-end // self.RATE)
+            self._output = self._shake.digest(blocks * self.RATE)
+        output = self._output[self._index : end]
+        self._index = end
+        return output
+
+
+class BytesStream:
+    """
+    Read a fixed byte string as a stream, so that the output of an XOF
+    given as bytes can be sampled as from :py:class:`Shake128Stream`.
+
+    Reads are cut to a whole number of three byte groups of the remaining
+    bytes, and reading once every byte has been used raises a ValueError.
+    """
+
+    def __init__(self, input_bytes):
+        self._input = bytes(input_bytes)
+        self._index = 0
+
+    def read(self, n):
+        """
+        Return the next ``n`` bytes, or fewer at the end of the input
+        """
+        remaining = len(self._input) - self._index
+        end = self._index + min(n, remaining - remaining % 3)
+        if n and end == self._index:
+            raise ValueError("Not enough bytes to sample the polynomial")
+        output = self._input[self._index : end]
+        self._index = end
+        return output
@@ -0,0 +1,51 @@
+"""
+Reference implementations shared by the tests of the samplers
+"""
+
+from hashlib import shake_128
+
+
+def parse_ntt_sample(output, n=256):
+    """
+    Return the first ``n`` coefficients accepted by rejection sampling
+    from the bytes ``output``, following Algorithm 6 (Sample NTT) of
+    FIPS 203
+    """
+    coeffs = []
+    for i in range(0, len(output) - 2, 3):
+        d1 = output[i] + 256 * (output[i + 1] % 16)
+        d2 = (output[i + 1] // 16) + 16 * output[i + 2]
+        coeffs += [d for d in (d1, d2) if d < 3329]
+    return coeffs[:n]
+
+
+def rejecting_output(blocks, accepted=16, extra=1680):
+    """
+    Return XOF output whose first ``blocks`` blocks of 168 bytes give only
+    ``accepted`` candidates less than q, followed by ``extra`` bytes of the
+    output of SHAKE128
+    """
+    # Every triple of 0xff bytes gives two candidates of 4095, which are
+    # rejected, and the others give two candidates less than q
+    triples = [b"\xff\xff\xff"] * (56 * blocks)
+    step = len(triples) // (accepted // 2)
+    for i in range(accepted // 2):
+        triples[i * step] = bytes([i % 256, i % 12, 0])
+    return b"".join(triples) + shake_128(b"rejecting").digest(extra)
+
+
+class StubStream:
+    """
+    A stream over fixed bytes, which records the size of every read
+    """
+
+    def __init__(self, output):
+        self.output = output
+        self.index = 0
+        self.reads = []
+
+    def read(self, n):
+        self.reads.append(n)
+        output = self.output[self.index : self.index + n]
+        self.index += n
+        return output
@@ -0,0 +1,138 @@
+import unittest
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from kyber_py.ml_kem.default_parameters import DEFAULT_PARAMETERS
+from kyber_py.ml_kem.asynchronous import AsyncML_KEM
+
+
+class TestAsyncML_KEM(unittest.TestCase):
+    executor = "thread"
+
+    def run_kem(self, test, **kwargs):
+        async def main():
+            async with AsyncML_KEM(
+                DEFAULT_PARAMETERS["ML512"], executor=self.executor, **kwargs
+            ) as kem:
+                await test(kem)
+                return kem.stats()
+
+        return asyncio.run(main())
+
+    def test_keygen_encaps_decaps(self):
+        async def test(kem):
+            ek, dk = await kem.keygen()
+            results = await asyncio.gather(*[kem.encaps(ek) for _ in range(4)])
+            Ks = await asyncio.gather(*[kem.decaps(dk, c) for _, c in results])
+            self.assertEqual([K for K, _ in results], Ks)
+            self.assertEqual(
+                await kem.key_derive(bytes(64)),
+                kem.kem.key_derive(bytes(64)),
+            )
+
+        stats = self.run_kem(test, max_workers=2, max_concurrency=1)
+        self.assertEqual(stats.completed, 10)
+        self.assertEqual(
+            (stats.queued, stats.running, stats.failed), (0, 0, 0)
+        )
+        self.assertGreaterEqual(stats.max_queued, 3)
+
+    def test_loaded_keys(self):
+        async def test(kem):
+            ek, dk = await kem.keygen()
+            loaded_ek = kem.kem.load_encapsulation_key(ek)
+            loaded_dk = kem.kem.load_decapsulation_key(dk)
+            K, c = await kem.encaps(loaded_ek)
+            self.assertEqual(await kem.decaps(loaded_dk, c), K)
+
+        self.run_kem(test, max_workers=1)
+
+    def test_aclose(self):
+        async def main():
+            kem = AsyncML_KEM(
+                DEFAULT_PARAMETERS["ML512"], executor=self.executor
+            )
+            await kem.keygen()
+            await kem.aclose()
+            return kem
+
+        kem = asyncio.run(main())
+        if kem._owns_executor:
+            self.assertRaises(RuntimeError, lambda: kem.executor.submit(int))
+
+    def test_cancel(self):
+        if self.executor == "process":
+            self.skipTest("the call is patched in this process")
+        started, release = threading.Event(), threading.Event()
+
+        def blocking_keygen():
+            started.set()
+            release.wait()
+            return b"ek", b"dk"
+
+        async def test(kem):
+            kem.kem.keygen = blocking_keygen
+            loop = asyncio.get_running_loop()
+            task = asyncio.create_task(kem.keygen())
+            await loop.run_in_executor(None, started.wait)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            # The call still holds the only permit until it returns
+            waiting = asyncio.create_task(kem.keygen())
+            try:
+                await asyncio.sleep(0.01)
+                self.assertEqual(kem.stats().running, 1)
+                self.assertEqual(kem.stats().queued, 1)
+            finally:
+                release.set()
+            self.assertEqual(await waiting, (b"ek", b"dk"))
+
+        stats = self.run_kem(test, max_workers=2, max_concurrency=1)
+        self.assertEqual(
+            (stats.completed, stats.failed, stats.cancelled), (1, 0, 1)
+        )
+        self.assertEqual((stats.queued, stats.running), (0, 0))
+
+    def test_failure(self):
+        async def test(kem):
+            _, dk = await kem.keygen()
+            with self.assertRaises(ValueError):
+                await kem.decaps(dk, b"1")
+
+        stats = self.run_kem(test, max_workers=1)
+        self.assertEqual((stats.completed, stats.failed), (1, 1))
+
+    def test_bad_arguments(self):
+        params = DEFAULT_PARAMETERS["ML512"]
+        self.assertRaises(
+            ValueError, lambda: AsyncML_KEM(params, executor="fibers")
+        )
+        self.assertRaises(
+            ValueError,
+            lambda: AsyncML_KEM(
+                params, executor=self.executor, max_concurrency=-1
+            ),
+        )
+        self.assertRaises(
+            ValueError,
+            lambda: AsyncML_KEM(
+                params, executor=self.executor, max_concurrency=0
+            ),
+        )
+        with ProcessPoolExecutor(1) as pool:
+            self.assertRaises(
+                ValueError, lambda: AsyncML_KEM(params, executor=pool)
+            )
+
+
+class TestAsyncML_KEM_Process(TestAsyncML_KEM):
+    executor = "process"
+
+
+class TestAsyncML_KEM_Executor(TestAsyncML_KEM):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(2)
+
+    def tearDown(self):
+        self.executor.shutdown()
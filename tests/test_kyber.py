@@ -2,6 +2,8 @@ import unittest
 import os
 import pytest
 from kyber_py.kyber import Kyber512, Kyber768, Kyber1024
+from kyber_py.kyber.default_parameters import DEFAULT_PARAMETERS
+from kyber_py.kyber.kyber import Kyber
 from kyber_py.drbg.aes256_ctr_drbg import AES256_CTR_DRBG
 
 
@@ -53,6 +55,18 @@ class TestKyber(unittest.TestCase):
     def test_kyber1024(self):
         self.generic_test_kyber(Kyber1024, 5)
 
+    def test_matrix_cache(self):
+        kyber = Kyber(DEFAULT_PARAMETERS["kyber_768"])
+        kyber.enable_matrix_cache(maxsize=1)
+        pk, sk = kyber.keygen()
+        for _ in range(3):
+            key, c = kyber.encaps(pk)
+            self.assertEqual(kyber.decaps(sk, c), key)
+        info = kyber.matrix_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (5, 1, 1))
+        kyber.disable_matrix_cache()
+        self.assertIsNone(kyber.matrix_cache_info())
+
     def test_xof_failure(self):
         self.assertRaises(ValueError, lambda: Kyber512._xof(b"1", b"2", b"3"))
 
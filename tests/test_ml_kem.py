@@ -1,6 +1,13 @@
 import unittest
 import json
+import os
+import subprocess
+import sys
+from unittest import mock
 from kyber_py.ml_kem import ML_KEM_512, ML_KEM_768, ML_KEM_1024
+from kyber_py.ml_kem.default_parameters import DEFAULT_PARAMETERS
+from kyber_py.ml_kem.ml_kem import ML_KEM, CBDSampler
+from kyber_py.polynomials.polynomials_numpy import HAVE_NUMPY
 
 
 class TestML_KEM(unittest.TestCase):
@@ -83,6 +90,111 @@ class TestML_KEM(unittest.TestCase):
         dk_bad = b"0" * len(dk)
         self.assertRaises(ValueError, lambda: ML_KEM_512.decaps(dk_bad, c))
 
+    def test_generate_matrix_transpose(self):
+        rho = os.urandom(32)
+        A_hat = ML_KEM_768._generate_matrix_from_seed(rho)
+        A_hat_T = ML_KEM_768._generate_matrix_from_seed(rho, transpose=True)
+        self.assertEqual(A_hat_T, A_hat.T)
+        self.assertFalse(A_hat_T._transpose)
+
+    def test_matrix_vector_from_seed(self):
+        R, M = ML_KEM_1024.R, ML_KEM_1024.M
+        rho = os.urandom(32)
+        v_hat = M.vector([R.random_element().to_ntt() for _ in range(4)])
+        for transpose in (False, True):
+            A_hat = ML_KEM_1024._generate_matrix_from_seed(rho, transpose)
+            self.assertEqual(
+                ML_KEM_1024._matrix_vector_from_seed(rho, v_hat, transpose),
+                A_hat @ v_hat,
+            )
+            acc = M.vector([R.random_element().to_ntt() for _ in range(4)])
+            expected = A_hat @ v_hat + acc
+            self.assertIs(
+                ML_KEM_1024._matrix_vector_from_seed(
+                    rho, v_hat, transpose, acc=acc
+                ),
+                acc,
+            )
+            self.assertEqual(acc, expected)
+
+    def test_cbd_sampler(self):
+        R = ML_KEM_512.R
+        seed = os.urandom(32)
+        schedule = [(3, 2, True), (3, 1, True), (2, 2, False), (2, 1, True)]
+        drawn = CBDSampler(R, seed).draw(schedule)
+        self.assertEqual([len(polys) for polys in drawn], [2, 1, 2, 1])
+        N = 0
+        for (eta, _, ntt), polys in zip(schedule, drawn):
+            for f in polys:
+                g = R.cbd(ML_KEM_512._prf(eta, seed, bytes([N])), eta)
+                self.assertEqual(f, g.to_ntt() if ntt else g)
+                N += 1
+
+        sampler = CBDSampler(R, seed, N=3)
+        (f,), (g,) = sampler.draw([(2, 1, False), (2, 1, False)])
+        self.assertEqual(f, drawn[2][0])
+        self.assertEqual(g, drawn[2][1])
+        self.assertEqual(sampler.N, 5)
+        self.assertRaises(ValueError, lambda: CBDSampler(R, bytes(31)))
+
+    def test_keygen_batch(self):
+        kem = ML_KEM(DEFAULT_PARAMETERS["ML512"])
+        seed = os.urandom(48)
+        kem.set_drbg_seed(seed)
+        keys = [kem.keygen() for _ in range(3)]
+        kem.set_drbg_seed(seed)
+        self.assertEqual(kem.keygen_batch(3), keys)
+        self.assertEqual(kem.keygen_batch(0), [])
+
+        seeds = [os.urandom(64) for _ in range(3)]
+        self.assertEqual(
+            kem.key_derive_batch(seeds),
+            [kem.key_derive(seed) for seed in seeds],
+        )
+        self.assertRaises(
+            ValueError, lambda: kem.key_derive_batch([bytes(64), bytes(63)])
+        )
+
+    def test_encaps_batch(self):
+        keys = [ML_KEM_768.keygen() for _ in range(3)]
+        ek0 = ML_KEM_768.load_encapsulation_key(keys[0][0])
+        eks = [ek for ek, _ in keys] + [keys[1][0], ek0]
+        dks = [dk for _, dk in keys] + [keys[1][1], keys[0][1]]
+        ms = [os.urandom(32) for _ in eks]
+
+        batch = ML_KEM_768._encaps_internal_batch(eks, ms)
+        self.assertEqual(
+            batch,
+            [ML_KEM_768._encaps_internal(ek, m) for ek, m in zip(eks, ms)],
+        )
+        for (K, c), dk in zip(ML_KEM_768.encaps_batch(eks), dks):
+            self.assertEqual(ML_KEM_768.decaps(dk, c), K)
+        self.assertEqual(ML_KEM_768.encaps_batch([]), [])
+        self.assertRaises(
+            ValueError, lambda: ML_KEM_768.encaps_batch(eks + [b"1"])
+        )
+
+    def test_decaps_batch(self):
+        ek, dk = ML_KEM_768.keygen()
+        cs = [ML_KEM_768.encaps(ek)[1] for _ in range(3)]
+        cs.append(bytes([cs[0][0] ^ 1]) + cs[0][1:])
+        expected = [ML_KEM_768.decaps(dk, c) for c in cs]
+
+        self.assertEqual(ML_KEM_768.decaps_batch(dk, cs), expected)
+        loaded = ML_KEM_768.load_decapsulation_key(dk)
+        results = ML_KEM_768.decaps_batch(loaded, [cs[0], b"1"] + cs[1:])
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(results[:1] + results[2:], expected)
+
+        self.assertEqual(ML_KEM_768.decaps_batch(dk, []), [])
+        self.assertRaises(
+            ValueError, lambda: ML_KEM_768.decaps_batch(dk[:-1], cs)
+        )
+        self.assertRaises(
+            ValueError,
+            lambda: ML_KEM_512.decaps_batch(loaded, cs),
+        )
+
     def test_derive_with_wrong_seed_length(self):
         with self.assertRaises(ValueError) as e:
             ML_KEM_512.key_derive(bytes(range(63)))
@@ -242,6 +354,10 @@ class TestML_KEM_KAT(unittest.TestCase):
     https://github.com/usnistgov/ACVP-Server/releases/tag/v1.1.0.35
     """
 
+    ML_KEM_512 = ML_KEM_512
+    ML_KEM_768 = ML_KEM_768
+    ML_KEM_1024 = ML_KEM_1024
+
     def generic_keygen_kat(self, ML_KEM, index):
         with open("assets/ML-KEM-keyGen-FIPS203/internalProjection.json") as f:
             data = json.load(f)
@@ -257,6 +373,17 @@ class TestML_KEM_KAT(unittest.TestCase):
             self.assertEqual(ek, ek_kat)
             self.assertEqual(dk, dk_kat)
 
+        # The keys derived as a batch must match the vectors too
+        seeds = [
+            bytes.fromhex(test["d"]) + bytes.fromhex(test["z"])
+            for test in kat_data
+        ]
+        expected = [
+            (bytes.fromhex(test["ek"]), bytes.fromhex(test["dk"]))
+            for test in kat_data
+        ]
+        self.assertEqual(ML_KEM.key_derive_batch(seeds), expected)
+
     def generic_encap_kat(self, ML_KEM, index):
         with open(
             "assets/ML-KEM-encapDecap-FIPS203/internalProjection.json"
@@ -297,28 +424,248 @@ class TestML_KEM_KAT(unittest.TestCase):
             self.assertEqual(K, k_kat)
 
     def test_ML_KEM_512_keygen(self):
-        self.generic_keygen_kat(ML_KEM_512, 0)
+        self.generic_keygen_kat(self.ML_KEM_512, 0)
 
     def test_ML_KEM_768_keygen(self):
-        self.generic_keygen_kat(ML_KEM_768, 1)
+        self.generic_keygen_kat(self.ML_KEM_768, 1)
 
     def test_ML_KEM_1024_keygen(self):
-        self.generic_keygen_kat(ML_KEM_1024, 2)
+        self.generic_keygen_kat(self.ML_KEM_1024, 2)
 
     def test_ML_KEM_512_encap(self):
-        self.generic_encap_kat(ML_KEM_512, 0)
+        self.generic_encap_kat(self.ML_KEM_512, 0)
 
     def test_ML_KEM_768_encap(self):
-        self.generic_encap_kat(ML_KEM_768, 1)
+        self.generic_encap_kat(self.ML_KEM_768, 1)
 
     def test_ML_KEM_1024_encap(self):
-        self.generic_encap_kat(ML_KEM_1024, 2)
+        self.generic_encap_kat(self.ML_KEM_1024, 2)
 
     def test_ML_KEM_512_decap(self):
-        self.generic_decap_kat(ML_KEM_512, 0)
+        self.generic_decap_kat(self.ML_KEM_512, 0)
 
     def test_ML_KEM_768_decap(self):
-        self.generic_decap_kat(ML_KEM_768, 1)
+        self.generic_decap_kat(self.ML_KEM_768, 1)
 
     def test_ML_KEM_1024_decap(self):
-        self.generic_decap_kat(ML_KEM_1024, 2)
+        self.generic_decap_kat(self.ML_KEM_1024, 2)
+
+
+@unittest.skipUnless(HAVE_NUMPY, "requires numpy")
+class TestML_KEM_KAT_Numpy(TestML_KEM_KAT):
+    """
+    Test the NumPy backend of ML-KEM against the same test vectors
+    """
+
+    ML_KEM_512 = ML_KEM(DEFAULT_PARAMETERS["ML512"], backend="numpy")
+    ML_KEM_768 = ML_KEM(DEFAULT_PARAMETERS["ML768"], backend="numpy")
+    ML_KEM_1024 = ML_KEM(DEFAULT_PARAMETERS["ML1024"], backend="numpy")
+
+    def test_backend(self):
+        self.assertEqual(self.ML_KEM_512.backend, "numpy")
+
+
+class TestML_KEM_Backend(unittest.TestCase):
+    def test_default_backend(self):
+        self.assertEqual(ML_KEM_512.backend, "python")
+
+    def test_unknown_backend(self):
+        self.assertRaises(
+            ValueError,
+            lambda: ML_KEM(DEFAULT_PARAMETERS["ML512"], backend="rust"),
+        )
+
+    def test_numpy_fallback(self):
+        with mock.patch(
+            "kyber_py.polynomials.polynomials_numpy.HAVE_NUMPY", False
+        ):
+            kem = ML_KEM(DEFAULT_PARAMETERS["ML512"], backend="numpy")
+        self.assertEqual(kem.backend, "python")
+        ek, dk = kem.keygen()
+        K, c = kem.encaps(ek)
+        self.assertEqual(K, kem.decaps(dk, c))
+
+    def test_default_backend_does_not_import_numpy(self):
+        code = (
+            "import sys, kyber_py.ml_kem; "
+            "kyber_py.ml_kem.ML_KEM_512.keygen(); "
+            "sys.exit('numpy' in sys.modules)"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run([sys.executable, "-c", code], env=env)
+        self.assertEqual(result.returncode, 0)
+
+
+class TestML_KEM_MatrixCache(unittest.TestCase):
+    backend = "python"
+
+    def setUp(self):
+        self.kem = ML_KEM(DEFAULT_PARAMETERS["ML768"], backend=self.backend)
+        self.uncached = ML_KEM(
+            DEFAULT_PARAMETERS["ML768"], backend=self.backend
+        )
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(self.kem.matrix_cache_info())
+        ek, _ = self.kem.keygen()
+        self.kem.encaps(ek)
+        self.assertIsNone(self.kem.matrix_cache_info())
+
+    def test_cache_hits(self):
+        self.kem.enable_matrix_cache()
+        ek, dk = self.kem.keygen()
+        # key generation does not populate the cache
+        self.assertEqual(self.kem.matrix_cache_info().currsize, 0)
+        for _ in range(3):
+            m = os.urandom(32)
+            K, c = self.kem._encaps_internal(ek, m)
+            self.assertEqual((K, c), self.uncached._encaps_internal(ek, m))
+            self.assertEqual(self.kem.decaps(dk, c), K)
+        info = self.kem.matrix_cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 5)
+        self.assertEqual(info.currsize, 1)
+        self.assertGreater(info.nbytes, 0)
+
+    def test_eviction(self):
+        self.kem.enable_matrix_cache(maxsize=2)
+        keys = [self.kem.keygen()[0] for _ in range(3)]
+        for ek in keys + keys[-1:]:
+            self.kem.encaps(ek)
+        info = self.kem.matrix_cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 3))
+        self.assertEqual((info.evictions, info.currsize), (1, 2))
+        self.assertNotIn((keys[0][-32:], True), self.kem.matrix_cache)
+
+    def test_memory_cap(self):
+        ek, _ = self.kem.keygen()
+        self.kem.enable_matrix_cache()
+        self.kem.encaps(ek)
+        nbytes = self.kem.matrix_cache_info().nbytes
+
+        self.kem.enable_matrix_cache(maxbytes=nbytes)
+        self.kem.encaps(ek)
+        self.kem.encaps(self.kem.keygen()[0])
+        info = self.kem.matrix_cache_info()
+        self.assertEqual((info.evictions, info.currsize), (1, 1))
+        self.assertLessEqual(info.nbytes, nbytes)
+
+        # a matrix larger than the cap is not cached at all
+        self.kem.enable_matrix_cache(maxbytes=nbytes - 1)
+        self.kem.encaps(ek)
+        self.assertEqual(self.kem.matrix_cache_info().currsize, 0)
+
+    def test_clear_and_disable(self):
+        self.kem.enable_matrix_cache()
+        ek, _ = self.kem.keygen()
+        self.kem.encaps(ek)
+        self.kem.encaps(ek)
+        self.kem.clear_matrix_cache()
+        self.assertEqual(
+            tuple(self.kem.matrix_cache_info()[:5]), (0, 0, 0, 0, 0)
+        )
+        self.kem.disable_matrix_cache()
+        self.assertIsNone(self.kem.matrix_cache_info())
+        self.kem.clear_matrix_cache()
+
+    def test_bad_bounds(self):
+        self.assertRaises(
+            ValueError, lambda: self.kem.enable_matrix_cache(maxsize=0)
+        )
+        self.assertRaises(
+            ValueError, lambda: self.kem.enable_matrix_cache(maxbytes=0)
+        )
+
+
+@unittest.skipUnless(HAVE_NUMPY, "NumPy is not installed")
+class TestML_KEM_MatrixCache_Numpy(TestML_KEM_MatrixCache):
+    backend = "numpy"
+
+
+class TestML_KEM_LoadedKeys(unittest.TestCase):
+    backend = "python"
+
+    def setUp(self):
+        self.kem = ML_KEM(DEFAULT_PARAMETERS["ML768"], backend=self.backend)
+
+    def test_encaps_loaded_key(self):
+        ek, dk = self.kem.keygen()
+        loaded = self.kem.load_encapsulation_key(ek)
+        self.assertTrue(loaded.validated)
+        self.assertEqual(bytes(loaded), ek)
+        self.assertEqual(loaded.h, self.kem._H(ek))
+        for _ in range(3):
+            m = os.urandom(32)
+            K, c = self.kem._encaps_internal(loaded, m)
+            self.assertEqual((K, c), self.kem._encaps_internal(ek, m))
+            K, c = self.kem.encaps(loaded)
+            self.assertEqual(self.kem.decaps(dk, c), K)
+
+    def test_load_invalid_encapsulation_key(self):
+        ek, _ = self.kem.keygen()
+        self.assertRaises(
+            ValueError, lambda: self.kem.load_encapsulation_key(ek[:-1])
+        )
+        bad_ek = bytes([255]) * 384 * self.kem.k + ek[-32:]
+        self.assertRaises(
+            ValueError, lambda: self.kem.load_encapsulation_key(bad_ek)
+        )
+
+    def test_loaded_encapsulation_key_immutable(self):
+        loaded = self.kem.load_encapsulation_key(self.kem.keygen()[0])
+        with self.assertRaises(AttributeError):
+            loaded.h = bytes(32)
+        with self.assertRaises(AttributeError):
+            del loaded.ek
+        self.assertFalse(hasattr(loaded, "t_hat"))
+        self.assertFalse(hasattr(loaded, "A_hat_T"))
+
+    def test_encapsulation_key_other_instance(self):
+        ek, _ = self.kem.keygen()
+        loaded = ML_KEM_768.load_encapsulation_key(ek)
+        self.assertNotEqual(loaded, self.kem.load_encapsulation_key(ek))
+        self.assertEqual(loaded, ML_KEM_768.load_encapsulation_key(ek))
+        self.assertRaises(ValueError, lambda: self.kem.encaps(loaded))
+
+    def test_decaps_loaded_key(self):
+        ek, dk = self.kem.keygen()
+        loaded = self.kem.load_decapsulation_key(dk)
+        self.assertTrue(loaded.validated)
+        self.assertEqual(bytes(loaded), dk)
+        self.assertEqual(loaded.ek, self.kem.load_encapsulation_key(ek))
+        for _ in range(3):
+            K, c = self.kem.encaps(ek)
+            self.assertEqual(self.kem.decaps(loaded, c), K)
+            # implicit rejection matches the byte-encoded key
+            bad_c = bytes([c[0] ^ 1]) + c[1:]
+            self.assertEqual(
+                self.kem.decaps(loaded, bad_c), self.kem.decaps(dk, bad_c)
+            )
+        self.assertRaises(ValueError, lambda: self.kem.decaps(loaded, c[:-1]))
+
+    def test_load_invalid_decapsulation_key(self):
+        _, dk = self.kem.keygen()
+        self.assertRaises(
+            ValueError, lambda: self.kem.load_decapsulation_key(dk[:-1])
+        )
+        n = 768 * self.kem.k + 32
+        bad_dk = dk[:n] + bytes(32) + dk[n + 32 :]
+        self.assertRaises(
+            ValueError, lambda: self.kem.load_decapsulation_key(bad_dk)
+        )
+
+    def test_decapsulation_key_other_instance(self):
+        ek, dk = self.kem.keygen()
+        K, c = self.kem.encaps(ek)
+        loaded = ML_KEM_768.load_decapsulation_key(dk)
+        self.assertRaises(ValueError, lambda: self.kem.decaps(loaded, c))
+        self.assertEqual(ML_KEM_768.decaps(loaded, c), K)
+        with self.assertRaises(AttributeError):
+            loaded.z = bytes(32)
+        self.assertFalse(hasattr(loaded, "s_hat"))
+        self.assertNotIn(dk.hex()[:16], repr(loaded))
+
+
+@unittest.skipUnless(HAVE_NUMPY, "NumPy is not installed")
+class TestML_KEM_LoadedKeys_Numpy(TestML_KEM_LoadedKeys):
+    backend = "numpy"
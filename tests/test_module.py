@@ -1,6 +1,10 @@
 import unittest
 from random import randint
 from kyber_py.modules.modules import Module
+from kyber_py.polynomials.polynomials_numpy import (
+    PolynomialRingNumpy,
+    HAVE_NUMPY,
+)
 
 
 class TestModuleKyber(unittest.TestCase):
@@ -14,7 +18,162 @@ class TestModuleKyber(unittest.TestCase):
             v_bytes = v.encode(12)
             self.assertEqual(v, self.M.decode_vector(v_bytes, k, 12))
 
+    def test_decode_vector_all_widths(self):
+        for d in (1, 4, 5, 10, 11, 12):
+            k = randint(1, 4)
+            v = self.M.vector(
+                [
+                    self.R(
+                        [randint(0, min(2**d, 3329) - 1) for _ in range(256)]
+                    )
+                    for _ in range(k)
+                ]
+            )
+            v_bytes = v.encode(d)
+            self.assertEqual(len(v_bytes), 32 * d * k)
+            self.assertEqual(
+                v_bytes, b"".join(v[i, 0].encode(d) for i in range(k))
+            )
+            self.assertEqual(v, self.M.decode_vector(v_bytes, k, d))
+
+    def test_compress_encode_vector(self):
+        for d in (1, 4, 5, 10, 11):
+            k = randint(1, 4)
+            v = self.M.random_element(k, 1)
+            c = v.compress_encode(d)
+            self.assertEqual(c, v.compress(d).encode(d))
+            self.assertEqual(
+                self.M.decode_decompress_vector(c, k, d),
+                self.M.decode_vector(c, k, d).decompress(d),
+            )
+
     def test_recode_vector_wrong_length(self):
         self.assertRaises(
             ValueError, lambda: self.M.decode_vector(b"1", 2, 12)
         )
+
+    def test_ntt_matrix(self):
+        for _ in range(10):
+            m, n = randint(1, 4), randint(1, 4)
+            A = self.M.random_element(m, n)
+            A_copy = self.M(
+                [
+                    [self.R(A[i, j].coeffs.copy()) for j in range(n)]
+                    for i in range(m)
+                ]
+            )
+            A_hat = A.to_ntt()
+            self.assertEqual(A_hat.dim(), (m, n))
+            self.assertEqual(A_hat.T.dim(), (n, m))
+            for i in range(m):
+                for j in range(n):
+                    f = self.R(A_copy[i, j].coeffs.copy())
+                    self.assertEqual(A_hat[i, j], f.to_ntt())
+            self.assertEqual(A_hat.from_ntt(), A_copy)
+
+    def test_matmul_ntt(self):
+        for _ in range(10):
+            m, n, l = randint(1, 4), randint(1, 4), randint(1, 4)
+            A_hat = self.M.random_element(m, n).to_ntt()
+            B_hat = self.M.random_element(n, l).to_ntt()
+            C_hat = A_hat @ B_hat
+            self.assertEqual(C_hat.dim(), (m, l))
+            for i in range(m):
+                for j in range(l):
+                    c = A_hat[i, 0] * B_hat[0, j]
+                    for k in range(1, n):
+                        c = c + A_hat[i, k] * B_hat[k, j]
+                    self.assertEqual(C_hat[i, j], c)
+            self.assertEqual(B_hat.T @ A_hat.T, C_hat.T)
+
+    def test_matmul_ntt_out(self):
+        A_hat = self.M.random_element(3, 2).to_ntt()
+        B_hat = self.M.random_element(2, 3).to_ntt()
+        C_hat = self.M.random_element(3, 3).to_ntt()
+        self.assertIs(A_hat.matmul(B_hat, out=C_hat), C_hat)
+        self.assertEqual(C_hat, A_hat @ B_hat)
+
+        C_hat = self.M.random_element(3, 3).to_ntt().T
+        self.assertIs(B_hat.T.matmul(A_hat.T, out=C_hat), C_hat)
+        self.assertEqual(C_hat, B_hat.T @ A_hat.T)
+
+        self.assertRaises(ValueError, lambda: A_hat.matmul(B_hat, out=A_hat))
+
+        # Outputs aliasing either operand are rejected
+        A_hat = self.M.random_element(3, 3).to_ntt()
+        B_hat = self.M.random_element(3, 3).to_ntt()
+        self.assertRaises(ValueError, lambda: A_hat.matmul(B_hat, out=A_hat))
+        self.assertRaises(ValueError, lambda: A_hat.matmul(B_hat, out=B_hat))
+        self.assertRaises(ValueError, lambda: A_hat.matmul(A_hat, out=A_hat.T))
+        C_hat = self.M(
+            [
+                [self.R.random_element().to_ntt() for _ in range(2)]
+                + [B_hat[0, 0]]
+                for _ in range(3)
+            ]
+        )
+        self.assertRaises(ValueError, lambda: A_hat.matmul(B_hat, out=C_hat))
+        A = A_hat.from_ntt()
+        self.assertRaises(
+            TypeError, lambda: A.matmul(A.T, out=self.M.random_element(3, 3))
+        )
+
+    def test_ntt_matrix_out(self):
+        A = self.M.random_element(2, 3)
+        B = self.M.random_element(2, 3)
+        B_hat = self.M.random_element(3, 2).to_ntt().T
+        self.assertIs(A.to_ntt(out=B_hat), B_hat)
+        self.assertEqual(B_hat, A.to_ntt())
+        self.assertIs(B_hat.from_ntt(out=B), B)
+        self.assertEqual(B, A)
+        self.assertRaises(ValueError, lambda: A.to_ntt(out=A.T.to_ntt()))
+
+    def test_dot_ntt(self):
+        u_hat = self.M.random_element(3, 1).to_ntt()
+        v_hat = self.M.random_element(3, 1).to_ntt()
+        expected = sum(u_hat[i, 0] * v_hat[i, 0] for i in range(3))
+        self.assertEqual(u_hat.dot(v_hat), expected)
+
+    def test_matmul_wrong_dimensions(self):
+        A_hat = self.M.random_element(2, 3).to_ntt()
+        self.assertRaises(ValueError, lambda: A_hat @ A_hat)
+
+    def test_compact(self):
+        A = self.M.random_element(3, 3)
+        v = self.M.random_element(3, 1)
+        A_hat = A.to_ntt()
+        expected = (A_hat @ v.to_ntt()).from_ntt()
+        self.assertIs(A_hat.compact(), A_hat)
+        self.assertFalse(hasattr(A_hat, "__dict__"))
+        self.assertEqual(A_hat, A.to_ntt())
+        self.assertEqual((A_hat @ v.to_ntt()).from_ntt(), expected)
+
+    def test_ntt_matrix_wrong_domain(self):
+        A_hat = self.M.random_element(2, 2).to_ntt()
+        self.assertRaises(TypeError, lambda: A_hat.to_ntt())
+        self.assertRaises(TypeError, lambda: A_hat.from_ntt().from_ntt())
+
+
+@unittest.skipUnless(HAVE_NUMPY, "requires numpy")
+class TestModuleKyberNumpy(TestModuleKyber):
+    M = Module(PolynomialRingNumpy()) if HAVE_NUMPY else None
+    R = M.ring if HAVE_NUMPY else None
+
+    def test_nbytes_views(self):
+        # Coefficients sliced from a larger array, as by `ntt_sample()`
+        import numpy as np
+
+        buffers = [np.arange(4 * 256, dtype=np.int64) for _ in range(4)]
+        A_hat = self.M(
+            [
+                [self.R(b[:256], is_ntt=True) for b in buffers[:2]],
+                [self.R(b[:256], is_ntt=True) for b in buffers[2:]],
+            ]
+        )
+        self.assertGreaterEqual(A_hat.nbytes(), 4 * 256 * 8)
+        A_hat.compact()
+        for row in A_hat._data:
+            for ele in row:
+                self.assertIsNone(ele.coeffs.base)
+        self.assertGreaterEqual(A_hat.nbytes(), 4 * 256 * 8)
+        self.assertLess(A_hat.nbytes(), 4 * 4 * 256 * 8)
@@ -80,6 +80,24 @@ class TestMatrix(unittest.TestCase):
             B += C
             self.assertEqual(B, C + C)
 
+    def test_matrix_inplace(self):
+        for _ in range(100):
+            A = self.M.random_element(2, 2)
+            B = self.M.random_element(2, 2)
+            C = self.M.random_element(2, 2)
+
+            D = A + B
+            self.assertIs(D.add_inplace(C), D)
+            self.assertEqual(D, A + B + C)
+            self.assertIs(D.sub_inplace(A), D)
+            self.assertEqual(D, B + C)
+
+        A = self.M.random_element(2, 2)
+        self.assertRaises(TypeError, lambda: A.add_inplace("B"))
+        self.assertRaises(
+            ValueError, lambda: A.sub_inplace(self.M.random_element(2, 3))
+        )
+
     def test_sub_errors(self):
         A = self.M.random_element(2, 2)
         B = self.M.random_element(2, 3)
@@ -0,0 +1,61 @@
+import unittest
+import os
+from kyber_py.ml_kem import ML_KEM_512
+from kyber_py.ml_kem.default_parameters import DEFAULT_PARAMETERS
+from kyber_py.ml_kem.parallel import ParallelML_KEM
+
+
+class TestParallelML_KEM(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.kem = ParallelML_KEM(
+            DEFAULT_PARAMETERS["ML512"], max_workers=2, chunksize=2
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.kem.close()
+
+    def test_keygen_many(self):
+        keys = self.kem.keygen_many(5)
+        self.assertEqual(len(keys), 5)
+        self.assertEqual(len(set(keys)), 5)
+        for ek, dk in keys:
+            K, c = ML_KEM_512.encaps(ek)
+            self.assertEqual(ML_KEM_512.decaps(dk, c), K)
+        self.assertEqual(self.kem.keygen_many(0), [])
+
+    def test_key_derive_many(self):
+        seeds = [os.urandom(64) for _ in range(5)]
+        self.assertEqual(
+            self.kem.key_derive_many(seeds),
+            [ML_KEM_512.key_derive(seed) for seed in seeds],
+        )
+
+    def test_encaps_decaps_many(self):
+        keys = [ML_KEM_512.keygen() for _ in range(3)]
+        loaded = ML_KEM_512.load_encapsulation_key(keys[0][0])
+        eks = [ek for ek, _ in keys] + [loaded]
+        results = self.kem.encaps_many(eks)
+        self.assertEqual(len(results), 4)
+        for (K, c), (_, dk) in zip(results, keys + keys[:1]):
+            self.assertEqual(ML_KEM_512.decaps(dk, c), K)
+        self.assertRaises(ValueError, lambda: self.kem.encaps_many([b"1"]))
+
+    def test_decaps_many(self):
+        ek, dk = ML_KEM_512.keygen()
+        cs = [ML_KEM_512.encaps(ek)[1] for _ in range(4)] + [b"1"]
+        results = self.kem.decaps_many(dk, cs)
+        self.assertEqual(
+            results[:4], [ML_KEM_512.decaps(dk, c) for c in cs[:4]]
+        )
+        self.assertIsInstance(results[4], ValueError)
+
+    def test_chunks(self):
+        with ParallelML_KEM(DEFAULT_PARAMETERS["ML512"], max_workers=1) as kem:
+            self.assertEqual(kem._chunks(list(range(3))), [[0], [1], [2]])
+            self.assertEqual(len(kem._chunks(list(range(10)))), 4)
+        self.assertRaises(
+            ValueError,
+            lambda: ParallelML_KEM(DEFAULT_PARAMETERS["ML512"], chunksize=0),
+        )
@@ -1,5 +1,18 @@
 import unittest
+import os
+from hashlib import shake_128
+from random import randint
+from kyber_py.utilities.xof import Shake128Stream
 from kyber_py.polynomials.polynomials import PolynomialRing
+from reference_sampling import (
+    StubStream,
+    parse_ntt_sample,
+    rejecting_output,
+)
+from kyber_py.polynomials.polynomials_numpy import (
+    PolynomialRingNumpy,
+    HAVE_NUMPY,
+)
 
 
 class TestModuleKyber(unittest.TestCase):
@@ -14,6 +27,93 @@ class TestModuleKyber(unittest.TestCase):
     def test_decode_wrong_length(self):
         self.assertRaises(ValueError, lambda: self.R.decode(b"1", 12))
 
+    def test_decode_reduces_coefficients(self):
+        coeffs = list(range(3329 - 128, 3329 + 128))
+        t = sum(c << (12 * i) for i, c in enumerate(coeffs))
+        f_bytes = t.to_bytes(384, "little")
+        f = self.R.decode(f_bytes, 12)
+        self.assertEqual(list(f), [c % 3329 for c in coeffs])
+
+    def test_encode_decode_all_widths(self):
+        for d in range(1, 13):
+            coeffs = [randint(0, min(2**d, 3329) - 1) for _ in range(256)]
+            f_bytes = self.R(coeffs).encode(d)
+            t = sum(c << (d * i) for i, c in enumerate(coeffs))
+            self.assertEqual(f_bytes, t.to_bytes(32 * d, "little"))
+            self.assertEqual(list(self.R.decode(f_bytes, d)), coeffs)
+
+    def test_compress_decompress(self):
+        # Check every coefficient against the definition of compression
+        xs = list(range(3329)) + [0] * 255
+        for d in range(1, 12):
+            for i in range(0, len(xs), 256):
+                x = xs[i : i + 256]
+                y = [round(c * 2**d / 3329) % 2**d for c in x]
+                self.assertEqual(list(self.R(x).compress(d)), y)
+
+                z = [(c * 3329 + 2 ** (d - 1)) // 2**d for c in y]
+                self.assertEqual(list(self.R(y).decompress(d)), z)
+
+    def test_compress_encode(self):
+        for d in (1, 4, 5, 10, 11):
+            f = self.R.random_element()
+            f_copy = self.R(list(f))
+            c = f.compress_encode(d)
+            self.assertEqual(f, f_copy)
+            self.assertEqual(c, f_copy.compress(d).encode(d))
+            self.assertEqual(
+                self.R.decode_decompress(c, d),
+                self.R.decode(c, d).decompress(d),
+            )
+
+    def test_ntt_sample(self):
+        for blocks in (1, 3):
+            seed = os.urandom(34)
+            coeffs = parse_ntt_sample(shake_128(seed).digest(1680))
+
+            f = self.R.ntt_sample(Shake128Stream(seed, blocks=blocks))
+            self.assertIsInstance(f, self.R.element_ntt)
+            self.assertEqual(list(f), coeffs)
+
+    def test_ntt_sample_rejections(self):
+        # Three blocks which are mostly rejected force further reads
+        output = rejecting_output(3)
+        xof = StubStream(output)
+        f = self.R.ntt_sample(xof)
+        self.assertGreater(len(xof.reads), 1)
+        self.assertEqual(list(f), parse_ntt_sample(output))
+
+        # The output of the XOF may also be given as bytes
+        self.assertEqual(self.R.ntt_sample(output), f)
+        self.assertEqual(self.R.ntt_sample(bytearray(output)), f)
+        self.assertRaises(ValueError, lambda: self.R.ntt_sample(output[:600]))
+
+    def test_cbd(self):
+        for eta in range(1, 9):
+            for _ in range(10):
+                input_bytes = os.urandom(64 * eta)
+                bits = int.from_bytes(input_bytes, "little")
+                coeffs = []
+                for i in range(256):
+                    x = bits >> (2 * eta * i)
+                    a = bin(x % 2**eta).count("1")
+                    b = bin((x >> eta) % 2**eta).count("1")
+                    coeffs.append((a - b) % 3329)
+
+                f = self.R.cbd(input_bytes, eta)
+                self.assertEqual(list(f), coeffs)
+
+        self.assertRaises(ValueError, lambda: self.R.cbd(bytes(576), 9))
+
+    def test_cbd_to_ntt_batch(self):
+        for eta in (1, 2, 3):
+            inputs = [os.urandom(64 * eta) for _ in range(5)]
+            batch = self.R.cbd_to_ntt_batch(inputs, eta)
+            self.assertEqual(len(batch), 5)
+            for f, input_bytes in zip(batch, inputs):
+                self.assertTrue(isinstance(f, self.R.element_ntt))
+                self.assertEqual(f, self.R.cbd(input_bytes, eta).to_ntt())
+
     def test_call(self):
         self.assertEqual(1, self.R(1))
         self.assertRaises(TypeError, lambda: self.R("a"))
@@ -111,6 +211,91 @@ class TestPolynomial(unittest.TestCase):
             self.assertEqual(f1 * f1 * f1, f1**3)
             self.assertRaises(ValueError, lambda: f1 ** (-1))
 
+    def test_lazy_reduction(self):
+        for _ in range(10):
+            f1 = self.R.random_element()
+            f2 = self.R.random_element()
+            expected = self.R([(x - y) % 3329 for x, y in zip(f1, f2)])
+
+            f3 = f1 - f2
+            self.assertGreater(f3.bound, 3329)
+            self.assertEqual(f3, expected)
+            self.assertEqual(f3.encode(12), expected.encode(12))
+
+            f3.reduce_coefficients()
+            self.assertEqual(f3.bound, 3329)
+            self.assertTrue(all(0 <= c < 3329 for c in f3.coeffs))
+
+    def test_lazy_bound_exceeded(self):
+        R = type(self.R)()
+        R.lazy_bound = 4 * 3329
+        f1 = R.random_element()
+        f2 = f1
+        for _ in range(10):
+            f2 = f2 + f1
+            self.assertLessEqual(f2.bound, R.lazy_bound)
+        self.assertEqual(f2, f1 * 11)
+
+    def test_multiply_accumulate_ntt(self):
+        for k in range(1, 5):
+            fs = [self.R.random_element().to_ntt() for _ in range(k)]
+            gs = [self.R.random_element().to_ntt() for _ in range(k)]
+            expected = fs[0] * gs[0]
+            for f, g in zip(fs[1:], gs[1:]):
+                expected = expected + f * g
+            mul_acc = self.R.element_ntt.multiply_accumulate
+            self.assertEqual(mul_acc(fs, gs), expected)
+
+    def test_compact(self):
+        for _ in range(10):
+            f1 = self.R.random_element()
+            f2 = self.R.random_element()
+            f3 = f1 - f2
+            g1 = self.R(list(f1)).compact()
+            g3 = (f1 - f2).compact()
+            self.assertEqual(g1, f1)
+            self.assertEqual(g3, f3)
+            self.assertEqual(g3.encode(12), f3.encode(12))
+            self.assertEqual(g1 + g3, f1 + f3)
+            self.assertEqual(g1 * g3, f1 * f3)
+            self.assertEqual(
+                g1.to_ntt().compact() * f2.to_ntt(), f1.to_ntt() * f2.to_ntt()
+            )
+
+    def test_slots(self):
+        f = self.R.random_element()
+        self.assertFalse(hasattr(f, "__dict__"))
+        self.assertFalse(hasattr(f.to_ntt(), "__dict__"))
+
+    def test_inplace_ntt(self):
+        for _ in range(10):
+            f1 = self.R.random_element()
+            f2 = self.R.random_element()
+            f1_hat, f2_hat = f1.to_ntt(), f2.to_ntt()
+
+            g_hat = self.R.random_element().to_ntt()
+            self.assertIs(f1.to_ntt(out=g_hat), g_hat)
+            self.assertEqual(g_hat, f1_hat)
+            g = self.R.random_element()
+            self.assertIs(f2_hat.from_ntt(out=g), g)
+            self.assertEqual(g, f2)
+
+            mul_acc = self.R.element_ntt.multiply_accumulate
+            self.assertIs(mul_acc([f1_hat], [f2_hat], out=g_hat), g_hat)
+            self.assertEqual(g_hat, f1_hat * f2_hat)
+            g_hat.mul_acc_inplace([f1_hat, f2_hat], [f2_hat, f2_hat])
+            self.assertEqual(g_hat, f1_hat * f2_hat * 2 + f2_hat * f2_hat)
+            g_hat.add_inplace(f1_hat).sub_inplace(f2_hat)
+            self.assertEqual(
+                g_hat, f1_hat * f2_hat * 2 + f2_hat * f2_hat + f1_hat - f2_hat
+            )
+
+        f = self.R.random_element()
+        self.assertRaises(TypeError, lambda: f.to_ntt(out=f))
+        self.assertRaises(
+            TypeError, lambda: f.to_ntt().from_ntt(out=f.to_ntt())
+        )
+
     def test_add_failure_ntt(self):
         f1 = self.R.random_element().to_ntt()
         self.assertRaises(NotImplementedError, lambda: f1 + "a")
@@ -183,3 +368,50 @@ class TestPolynomial(unittest.TestCase):
             f2_hat = f1_hat
             f2_hat *= f2_hat
             self.assertEqual(f1_hat * f1_hat, f2_hat)
+
+
+@unittest.skipUnless(HAVE_NUMPY, "requires numpy")
+class TestModuleKyberNumpy(TestModuleKyber):
+    R = PolynomialRingNumpy() if HAVE_NUMPY else None
+
+    def test_ntt_sample_refills(self):
+        # Five blocks which are mostly rejected force the block-wise
+        # filtering to refill and concatenate several times
+        output = rejecting_output(5, accepted=4)
+        xof = StubStream(output)
+        f = self.R.ntt_sample(xof)
+        self.assertEqual(xof.reads[0], 3 * 168)
+        self.assertGreaterEqual(len(xof.reads), 4)
+        self.assertEqual(list(f), parse_ntt_sample(output))
+        self.assertEqual(f.coeffs.dtype, "int64")
+
+
+@unittest.skipUnless(HAVE_NUMPY, "requires numpy")
+class TestPolynomialNumpy(TestPolynomial):
+    R = PolynomialRingNumpy() if HAVE_NUMPY else None
+    R_python = PolynomialRing()
+
+    def test_matches_python_backend(self):
+        for _ in range(10):
+            f = self.R_python.random_element()
+            g = self.R_python.random_element()
+            f_np = self.R(f.coeffs.copy())
+            g_np = self.R(g.coeffs.copy())
+
+            f_hat = f.to_ntt()
+            g_hat = g.to_ntt()
+            self.assertEqual(f_np.to_ntt().encode(12), f_hat.encode(12))
+            self.assertEqual(
+                (f_np.to_ntt() * g_np.to_ntt()).encode(12),
+                (f_hat * g_hat).encode(12),
+            )
+            self.assertEqual(
+                (f_np.to_ntt() + g_np.to_ntt()).from_ntt().encode(12),
+                (f_hat + g_hat).from_ntt().encode(12),
+            )
+            self.assertEqual(f_np.to_ntt().from_ntt().encode(12), f.encode(12))
+            for d in (1, 4, 5, 10, 11):
+                self.assertEqual(
+                    self.R(f.coeffs.copy()).compress(d).encode(d),
+                    self.R_python(f.coeffs.copy()).compress(d).encode(d),
+                )
@@ -121,6 +121,20 @@ class TestPolynomial(unittest.TestCase):
             f2 -= f1
             self.assertEqual(f2, zero)
 
+    def test_inplace_polynomials(self):
+        for _ in range(100):
+            f1 = self.R.random_element()
+            f2 = self.R.random_element()
+            f3 = self.R.random_element()
+
+            g = self.R(f1.coeffs.copy())
+            self.assertIs(g.add_inplace(f2), g)
+            self.assertEqual(g, f1 + f2)
+            self.assertIs(g.sub_inplace(f3), g)
+            self.assertEqual(g, f1 + f2 - f3)
+            self.assertIs(g.mul_acc_inplace([f1, f2], [f2, f3]), g)
+            self.assertEqual(g, f1 + f2 - f3 + f1 * f2 + f2 * f3)
+
     def test_mul_polynomials(self):
         zero = self.R(0)
         one = self.R(1)
@@ -151,6 +165,23 @@ class TestPolynomial(unittest.TestCase):
             self.assertEqual(f1 * f1 * f1, f1**3)
             self.assertRaises(ValueError, lambda: f1 ** (-1))
 
+    def test_mul_matches_schoolbook(self):
+        # Full, incomplete and no NTT, as well as a composite modulus
+        for q, n, layers in [
+            (17, 8, 3),
+            (3329, 256, 7),
+            (13, 16, 1),
+            (3329, 100, 0),
+            (15, 32, 0),
+        ]:
+            R = GenericPolynomialRing(q, n)
+            self.assertEqual(R.ntt_layers, layers)
+            for _ in range(5):
+                f1 = R.random_element()
+                f2 = R.random_element()
+                expected = R(f1._schoolbook_multiplication(f2))
+                self.assertEqual(f1 * f2, expected)
+
     def test_print(self):
         self.assertEqual(str(self.R(0)), "0")
         self.assertEqual(str(self.R(1)), "1")
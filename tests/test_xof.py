@@ -0,0 +1,34 @@
+import unittest
+import os
+from hashlib import shake_128
+from reference_sampling import parse_ntt_sample
+from kyber_py.utilities.xof import BytesStream, Shake128Stream
+from kyber_py.polynomials.polynomials import PolynomialRing
+
+
+class TestShake128Stream(unittest.TestCase):
+    def test_read_matches_digest(self):
+        seed = os.urandom(34)
+        expected = shake_128(seed).digest(2000)
+        for blocks in (1, 3):
+            xof = Shake128Stream(seed, blocks=blocks)
+            output = b"".join(xof.read(n) for n in (1, 167, 168, 500, 1164))
+            self.assertEqual(output, expected)
+
+    def test_bytes_stream(self):
+        xof = BytesStream(bytes(range(10)))
+        self.assertEqual(xof.read(3), bytes([0, 1, 2]))
+        # Reads are cut to whole groups of three bytes
+        self.assertEqual(xof.read(168), bytes(range(3, 9)))
+        self.assertRaises(ValueError, lambda: xof.read(168))
+
+    def test_ntt_sample_long_tail(self):
+        # The sampled polynomial must not depend on the number of blocks
+        # squeezed up front, and is the first 256 accepted coefficients
+        R = PolynomialRing()
+        seed = os.urandom(34)
+        coeffs = parse_ntt_sample(shake_128(seed).digest(1680))
+
+        for blocks in (1, 2, 3, 5):
+            f = R.ntt_sample(Shake128Stream(seed, blocks=blocks))
+            self.assertEqual(f, R(coeffs, is_ntt=True))